@@ -0,0 +1,446 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import pygame
+from ui_classes import (AnimationBatch, Bar, BarMovement, BlitBatch, Button, Circle, DirtyRects, Display, Ellipse,
+                        FontFitter, FontPool, Frame, Image, InputField, ObjectAnimation, Placement, Polygon, Rect,
+                        Scene, SlottedRect, SpatialGrid, Text, np)
+
+
+SAMPLE_STRINGS = [f'Label {n}: {"status " * (n % 5 + 1)}' for n in range(200)]
+IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_img.png')
+DISPLAY_SIZE = (1280, 720)
+
+
+def legacy_auto_size(text: str, font: str, max_width: int, max_height: int, margin: int) -> int:
+    font_size = 300
+    text_render = pygame.font.SysFont(font, font_size).render(text, True, (0, 0, 0))
+
+    size_factor_w = size_factor_h = 1
+    if text_render.get_width() != 0:
+        size_factor_w = (max_width - margin) / text_render.get_width()
+    if text_render.get_height() != 0:
+        size_factor_h = (max_height - margin) / text_render.get_height()
+
+    font_size = int(font_size * min(size_factor_w, size_factor_h))
+    pygame.font.SysFont(font, font_size)
+    return font_size
+
+
+def time_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(step: Callable[[int], object], iterations: int, warmup: int = 5, allocations: bool = True,
+            ops_per_iteration: int = 1) -> dict[str, float]:
+    """
+    Calls step(i) for every iteration and reports the per iteration time distribution in milliseconds and the
+    throughput in operations per second. When allocations is set, a second, traced pass reports the peak and
+    retained memory per iteration and the number of allocated blocks still alive afterwards.
+    """
+    for i in range(warmup):
+        step(i)
+
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        step(warmup + i)
+        samples.append(time.perf_counter() - start)
+
+    ordered = sorted(samples)
+    total = sum(samples)
+    result = {'iterations': iterations,
+              'mean_ms': statistics.fmean(samples) * 1e3,
+              'p50_ms': percentile(ordered, 0.50) * 1e3,
+              'p95_ms': percentile(ordered, 0.95) * 1e3,
+              'max_ms': ordered[-1] * 1e3,
+              'ops_per_s': iterations * ops_per_iteration / total if total > 0 else float('inf')}
+
+    if allocations:
+        traced = max(1, min(iterations, 50))
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for i in range(traced):
+            step(warmup + iterations + i)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+        result.update({'alloc_peak_kb': (peak - base) / 1024,
+                       'alloc_retained_kb_per_iter': (current - base) / 1024 / traced,
+                       'alloc_blocks_per_iter': blocks / traced})
+    return result
+
+
+def reset_state() -> None:
+    """Clears the class level registries of ui_classes, so every case starts from an empty UI."""
+    DirtyRects.enable(False)
+    BlitBatch.flush()
+    if Scene.active_scenes:
+        Scene.active_scenes[0].deactivate(deactivate_all=True)
+    Scene.all_scenes.clear()
+
+    Button.active_buttons.clear()
+    Button.spatial_index = SpatialGrid()
+    InputField.active_input = None
+    InputField.active_input_fields.clear()
+    InputField.spatial_index = SpatialGrid()
+
+    Bar.use_movement_engine(False)
+    Bar.active_bars.clear()
+    Bar.moving_bars.clear()
+
+    ObjectAnimation.reset_scheduler()
+    Frame.set(0)
+
+
+def random_rect(rng: random.Random, width: int, height: int) -> tuple[int, int, int, int]:
+    return rng.randrange(DISPLAY_SIZE[0] - width), rng.randrange(DISPLAY_SIZE[1] - height), width, height
+
+
+def random_color(rng: random.Random) -> tuple[int, int, int]:
+    return rng.randrange(256), rng.randrange(256), rng.randrange(256)
+
+
+def build_scene_objects(count: int, rng: random.Random) -> list:
+    objects = []
+    for _ in range(count):
+        objects.append(Rect(*random_rect(rng, 60, 40), color=random_color(rng), corner_radius_all=6))
+        x, y, _, _ = random_rect(rng, 40, 40)
+        objects.append(Circle(x=x + 20, y=y + 20, _radius=20, color=random_color(rng)))
+        x, y, _, _ = random_rect(rng, 50, 50)
+        objects.append(Polygon(polygon_points=[(x, y), (x + 50, y + 10), (x + 25, y + 50)], color=random_color(rng)))
+        objects.append(Ellipse(*random_rect(rng, 60, 30), color=random_color(rng)))
+        x, y, _, _ = random_rect(rng, 120, 30)
+        objects.append(Text(rng.choice(SAMPLE_STRINGS), x=x, y=y, resize_max_width=120, resize_max_height=30))
+        x, y, _, _ = random_rect(rng, 48, 48)
+        objects.append(Image(_path=IMAGE_PATH, x=x, y=y, resize_to=(48, 48)))
+        objects.append(Button(Rect(*random_rect(rng, 80, 30), color=random_color(rng)),
+                              _text=Text('Press'), pressed_color=(90, 90, 90)))
+        objects.append(InputField(random_rect(rng, 120, 30) + ((240, 240, 240),), rect_active_color=(255, 255, 255)))
+        objects.append(Bar(random_rect(rng, 100, 16) + ((60, 60, 60),), bar_color=(30, 180, 30)))
+    return objects
+
+
+def bench_scene_render(display: pygame.Surface, count: int, frames: int, allocations: bool,
+                       seed: int) -> dict[str, dict]:
+    reset_state()
+    rng = random.Random(seed)
+    objects = build_scene_objects(count, rng)
+    scene = Scene('benchmark scene', objects=objects)
+    scene.activate()
+
+    results = {'objects': len(objects),
+               'full_redraw': measure(lambda i: scene.render(display), frames, allocations=allocations)}
+
+    DirtyRects.enable()
+    scene.render(display)
+    results['dirty_idle'] = measure(lambda i: Scene.render_active(display), frames, allocations=allocations)
+
+    movers = [obj for obj in objects if isinstance(obj, Rect)][:max(1, count // 10)]
+
+    def move_some(i: int) -> None:
+        for rect in movers:
+            rect.x = (rect.x + 3) % (DISPLAY_SIZE[0] - rect.width)
+        Scene.render_active(display)
+
+    results['dirty_moving'] = measure(move_some, frames, allocations=allocations)
+    results['dirty_moving']['moving_objects'] = len(movers)
+    DirtyRects.enable(False)
+    return results
+
+
+def bench_font_autosize(repeat: int = 3) -> dict[str, float]:
+    FontPool.clear(reset_stats=True)
+    FontFitter.clear(reset_stats=True)
+
+    legacy = time_call(lambda: [legacy_auto_size(text, 'helvetica', 250, 50, 20) for text in SAMPLE_STRINGS],
+                       repeat)
+    metric_cold = time_call(lambda: (FontFitter.clear(), [FontFitter.fit(text, 'helvetica', max_width=250,
+                                                                         max_height=50, margin=20)
+                                                          for text in SAMPLE_STRINGS]), repeat)
+    metric_warm = time_call(lambda: [FontFitter.fit(text, 'helvetica', max_width=250, max_height=50, margin=20)
+                                     for text in SAMPLE_STRINGS], repeat)
+    construction = time_call(lambda: [Text(text, resize_max_width=250, resize_max_height=50)
+                                      for text in SAMPLE_STRINGS], repeat)
+
+    per_text = len(SAMPLE_STRINGS)
+    return {'legacy_fit_us': legacy / per_text * 1e6,
+            'metric_fit_cold_us': metric_cold / per_text * 1e6,
+            'metric_fit_memoized_us': metric_warm / per_text * 1e6,
+            'text_construction_us': construction / per_text * 1e6}
+
+
+def bench_text(display: pygame.Surface, count: int, frames: int, allocations: bool,
+               seed: int) -> dict[str, dict]:
+    reset_state()
+    results = {'autosize': bench_font_autosize()}
+    texts = [Text(text, resize_max_width=250, resize_max_height=50) for text in SAMPLE_STRINGS[:count]]
+
+    def construct(i: int) -> None:
+        Text(SAMPLE_STRINGS[i % len(SAMPLE_STRINGS)], resize_max_width=250, resize_max_height=50)
+
+    def rewrite(i: int) -> None:
+        text = texts[i % len(texts)]
+        text.text = SAMPLE_STRINGS[(i * 7) % len(SAMPLE_STRINGS)]
+        text.render(display)
+
+    results['construction'] = measure(construct, frames, allocations=allocations)
+    results['set_text_and_render'] = measure(rewrite, frames, allocations=allocations)
+
+    log_lines = [f'{n:05d} {SAMPLE_STRINGS[n % len(SAMPLE_STRINGS)]} {SAMPLE_STRINGS[(n * 3) % len(SAMPLE_STRINGS)]}'
+                 for n in range(256)]
+    wrapped_log = Text('\n'.join(log_lines[:64]), resize_max_width=400, resize_max_height=300, font_size=14,
+                       alignment=Placement.LEFT, word_wrap=True, first_line=None)
+
+    def append_multi_line(i: int) -> None:
+        Text('\n'.join(log_lines[i % 192 + 48:i % 192 + 64]), resize_max_width=400, resize_max_height=300,
+             alignment=Placement.LEFT, dynamic_multi_line=True).render(display)
+
+    def append_word_wrap(i: int) -> None:
+        wrapped_log.text = wrapped_log.text + '\n' + log_lines[i % len(log_lines)]
+        wrapped_log.render(display)
+
+    results['log_append_multi_line'] = measure(append_multi_line, max(1, frames // 10), warmup=1,
+                                               allocations=allocations)
+    results['log_append_word_wrap'] = measure(append_word_wrap, frames, allocations=allocations)
+    return results
+
+
+def bench_input_typing(display: pygame.Surface, count: int, frames: int, allocations: bool,
+                       seed: int) -> dict[str, dict]:
+    reset_state()
+    rng = random.Random(seed)
+    fields = [InputField((10, 10 + 40 * (n % 16), 300, 32, (240, 240, 240)), rect_active_color=(255, 255, 255),
+                         character_max=24) for n in range(count)]
+    keys = [pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char)
+            for char in (rng.choice('abcdefghijklmnopqrstuvwxyz0123456789') for _ in range(64))]
+    text_inputs = [pygame.event.Event(pygame.TEXTINPUT, text=key.unicode) for key in keys]
+    backspace = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode='\b')
+
+    def type_key(i: int) -> None:
+        field = fields[i // 24 % len(fields)]
+        if InputField.active_input is not field:
+            InputField.activate(field)
+        InputField.process_input(backspace if len(field.text_str) >= 24 else keys[i % len(keys)])
+        field.render(display)
+
+    results = {'keystroke': measure(type_key, frames, allocations=allocations)}
+
+    paste_text = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(4096))
+    for name, incremental in (('legacy', False), ('incremental', True)):
+        field = InputField((10, 10, 300, 32, (240, 240, 240)), incremental=incremental)
+        InputField.activate(field)
+        typed = text_inputs if incremental else keys
+
+        def paste(i: int) -> None:
+            field.text_str = ''
+            field.insert_text(paste_text)
+            field.render(display)
+
+        def type_long(i: int) -> None:
+            InputField.process_input(typed[i % len(typed)])
+            field.render(display)
+
+        results[f'paste_4kb_{name}'] = measure(paste, max(1, frames // 10), warmup=1, allocations=allocations)
+        results[f'keystroke_4kb_{name}'] = measure(type_long, frames, allocations=allocations)
+    return results
+
+
+def bench_button_hits(display: pygame.Surface, count: int, frames: int, allocations: bool,
+                      seed: int) -> dict[str, dict]:
+    reset_state()
+    rng = random.Random(seed)
+    buttons = [Button(Rect(*random_rect(rng, 60, 30), color=random_color(rng)), pressed_color=(90, 90, 90))
+               for _ in range(count)]
+    clicks = [(rng.randrange(DISPLAY_SIZE[0]), rng.randrange(DISPLAY_SIZE[1])) for _ in range(256)]
+    clicks_per_iteration = 16
+
+    def click(i: int) -> None:
+        for n in range(clicks_per_iteration):
+            Button.check_all_collisions(clicks[(i * clicks_per_iteration + n) % len(clicks)])
+            Button.release_push_buttons()
+
+    return {'buttons': len(buttons),
+            'click': measure(click, frames, allocations=allocations, ops_per_iteration=clicks_per_iteration)}
+
+
+def bench_bar_movement(display: pygame.Surface, count: int, frames: int, allocations: bool,
+                       seed: int) -> dict[str, dict]:
+    reset_state()
+    rng = random.Random(seed)
+    bars = [Bar(random_rect(rng, 100, 16) + ((60, 60, 60),), bar_color=(30, 180, 30)) for _ in range(count * 10)]
+    now = [0.0]
+    clock = BarMovement.clock
+    BarMovement.clock = lambda: now[0]
+
+    def frame(i: int) -> None:
+        now[0] += 1 / 60
+        for bar in bars[i % 10::10]:
+            bar.set_value(rng.uniform(0, 100))
+        Bar.process_all_bar_movement()
+        for bar in bars:
+            bar.render(display)
+
+    results = {'bars': len(bars), 'per_bar': measure(frame, frames, allocations=allocations)}
+    if np is not None:
+        Bar.use_movement_engine(True, capacity=len(bars))
+        results['engine'] = measure(frame, frames, allocations=allocations)
+        Bar.use_movement_engine(False)
+    BarMovement.clock = clock
+    return results
+
+
+def bench_animation(display: pygame.Surface, count: int, frames: int, allocations: bool,
+                    seed: int) -> dict[str, dict]:
+    reset_state()
+    rng = random.Random(seed)
+    action = ObjectAnimation.Action
+    rects = [Rect(*random_rect(rng, 40, 40), color=random_color(rng)) for _ in range(count * 10)]
+    animations = [ObjectAnimation([[action.MOVE, {'x': 60, 'time': 30}], [action.MOVE, {'x': -60, 'time': 30}],
+                                   [action.SCALE, {'width': 10, 'height': 10, 'time': 15}],
+                                   [action.SCALE, {'width': -10, 'height': -10, 'time': 15}]], [rect])
+                  for rect in rects]
+    for animation in animations:
+        animation.start()
+
+    def frame(i: int) -> None:
+        ObjectAnimation.update_animations()
+        Frame.increase()
+
+    results = {'objects': len(rects), 'frame_based': measure(frame, frames, allocations=allocations)}
+    for animation in animations:
+        animation.stop()
+
+    if np is not None:
+        now = [0.0]
+        batch = AnimationBatch(capacity=len(rects))
+
+        def batch_frame(i: int) -> None:
+            now[0] += 1 / 60
+            if i % 60 == 0:
+                for rect in rects:
+                    batch.add(rect, action.MOVE, start_time=now[0], x=60 if i % 120 == 0 else -60, duration=1.0)
+            batch.step(now[0])
+
+        results['batch'] = measure(batch_frame, frames, allocations=allocations)
+    return results
+
+
+def bench_shape_writes(display: pygame.Surface, count: int, frames: int, allocations: bool,
+                       seed: int) -> dict[str, dict]:
+    reset_state()
+    shape_count = count * 1000
+    results = {'shapes': shape_count}
+    for name, shape_cls in (('dataclass', Rect), ('slotted', SlottedRect)):
+        tracemalloc.start()
+        shapes = [shape_cls(n % DISPLAY_SIZE[0], n % DISPLAY_SIZE[1], 10, 10, color=(90, 90, 90))
+                  for n in range(shape_count)]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        def move(i: int) -> None:
+            for shape in shapes:
+                shape.x = i
+
+        def set_geometry(i: int) -> None:
+            for shape in shapes:
+                shape.set_geometry(i, i, 10, 10)
+
+        results[name] = {'bytes_per_shape': memory / shape_count,
+                         'x_write': measure(move, frames, allocations=False, ops_per_iteration=shape_count),
+                         'set_geometry': measure(set_geometry, frames, allocations=False,
+                                                 ops_per_iteration=shape_count)}
+    return results
+
+
+CASES: dict[str, Callable[..., dict]] = {'scene_render': bench_scene_render,
+                                         'text': bench_text,
+                                         'input_typing': bench_input_typing,
+                                         'button_hits': bench_button_hits,
+                                         'bar_movement': bench_bar_movement,
+                                         'animation': bench_animation,
+                                         'shape_writes': bench_shape_writes}
+
+
+def environment() -> dict[str, str]:
+    return {'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'pygame': pygame.version.ver,
+            'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+            'numpy': np.__version__ if np is not None else None,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER')}
+
+
+def print_results(results: dict, prefix: str = '') -> None:
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print_results(value, f'{prefix}{name}.')
+        elif isinstance(value, float):
+            print(f'{prefix + name:<52} {value:>14.3f}')
+        else:
+            print(f'{prefix + name:<52} {value!s:>14}')
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description='Headless benchmarks for ui_classes rendering and input.')
+    parser.add_argument('cases', nargs='*', metavar='case',
+                        help=f'cases to run, default all of: {", ".join(CASES)}')
+    parser.add_argument('--count', type=int, default=20, help='objects per display class (default 20)')
+    parser.add_argument('--frames', type=int, default=120, help='measured iterations per benchmark (default 120)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-alloc', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--json', nargs='?', const='-', metavar='PATH',
+                        help='write the results as JSON to PATH, or stdout when no path is given')
+    args = parser.parse_args(argv)
+
+    unknown = [case for case in args.cases if case not in CASES]
+    if unknown:
+        parser.error(f'unknown case(s): {", ".join(unknown)}')
+
+    pygame.init()
+    display = Display(DISPLAY_SIZE, 'benchmark').display
+
+    results = {'environment': environment(),
+               'settings': {'count': args.count, 'frames': args.frames, 'seed': args.seed,
+                            'allocations': not args.no_alloc},
+               'cases': {}}
+    for case in args.cases or CASES:
+        results['cases'][case] = CASES[case](display, args.count, args.frames, not args.no_alloc, args.seed)
+    reset_state()
+
+    if args.json == '-':
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        print_results(results)
+        if args.json is not None:
+            with open(args.json, 'w') as file:
+                json.dump(results, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
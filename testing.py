@@ -113,12 +113,12 @@ test_scene_1.activate()
 
 
 def update_window():
-    Scene.active_scenes[0].render()
+    dirty_rects = Scene.render_active()
 
     Button.release_push_buttons()
     Bar.process_all_bar_movement()
     oa.update_animations()
-    display_window.update()
+    display_window.update(dirty_rects)
 
 
 def main():
@@ -133,8 +133,8 @@ def main():
                     run = False
 
                 case pygame.KEYDOWN:
-                    if InputField.active_input is not None:
-                        match InputField.active_input.process_input(event):
+                    for command in Scene.dispatch_event(event):
+                        match command:
                             case 'block':
                                 if Scene.active_scenes[0] == test_scene_2:
                                     move_block()
@@ -193,8 +193,7 @@ def main():
                             print(f'block_pos: {moving_block.x}, {moving_block.y}')
 
                 case pygame.MOUSEBUTTONDOWN:
-                    Button.check_all_collisions()
-                    InputField.check_all_collisions()
+                    Scene.dispatch_event(event)
 
         update_window()
 
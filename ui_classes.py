@@ -1,7 +1,19 @@
+import time
+import heapq
+import re
+import json
+import functools
 import pygame
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
+from operator import attrgetter
 from collections.abc import Callable, Sequence, Iterable, MutableSequence, Mapping, MutableMapping, Hashable
 from typing import ClassVar, Protocol, runtime_checkable
+try:
+    import numpy as np
+except ImportError:
+    np = None
 pygame.font.init()
 
 T_COLOR = Sequence[int, int, int] | Sequence[int, int, int, int] | tuple[int, int, int]
@@ -105,6 +117,20 @@ class Display:
     fps: ClassVar[int] = 60
     _win: None = None
 
+    frame_history: ClassVar[int] = 600
+    dropped_frames: ClassVar[int] = 0
+    _frame_times: ClassVar[deque] = deque(maxlen=600)
+    _tick_end: ClassVar[float | None] = None
+
+    adaptive_fps: ClassVar[bool] = False
+    adaptive_rates: ClassVar[tuple[int, ...]] = (240, 165, 144, 120, 90, 75, 60, 50, 45, 40, 30, 25, 20, 15, 10)
+    adaptive_window: ClassVar[int] = 60
+    adaptive_lower_load: ClassVar[float] = 0.9
+    adaptive_raise_load: ClassVar[float] = 0.6
+    min_fps: ClassVar[int] = 30
+    max_fps: ClassVar[int | None] = None
+    _adaptive_frames: ClassVar[int] = 0
+
     @classmethod
     def window(cls):
         return cls._win
@@ -118,6 +144,7 @@ class Display:
         pygame.display.set_caption(self.title)
 
         Display._win = self.display
+        AssetCache.convert_all()
 
     @property
     def width(self) -> int:
@@ -131,19 +158,512 @@ class Display:
         self.display.fill(color)
 
     @staticmethod
-    def update() -> None:
-        pygame.display.update()
+    def update(rects: Sequence[pygame.Rect] | None = None) -> None:
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
 
     @classmethod
     def tick_frame(cls, increase_frame: int = 1):
-        cls.CLOCK.tick(cls.fps)
+        RenderProfiler.end_frame()
+        work_end = time.perf_counter()
+        cls.CLOCK.tick(cls.fps if cls.fps is not None else 0)
+        tick_end = time.perf_counter()
         Frame.increase(increase_frame)
 
+        if cls._tick_end is not None:
+            cls.record_frame(work_end - cls._tick_end, tick_end - work_end)
+        cls._tick_end = tick_end
+        if RenderProfiler.enabled:
+            RenderProfiler.begin_frame()
+
+    @classmethod
+    def record_frame(cls, work: float, sleep: float) -> None:
+        cls._frame_times.append((work, sleep))
+        if cls.fps:
+            cls.dropped_frames += max(0, round((work + sleep) * cls.fps) - 1)
+        if cls.adaptive_fps:
+            cls._adaptive_frames += 1
+            if cls._adaptive_frames >= cls.adaptive_window:
+                cls._adaptive_frames = 0
+                cls.adapt_fps()
+
+    @classmethod
+    def frame_stats(cls) -> dict[str, float | int | None]:
+        frame_count = len(cls._frame_times)
+        if frame_count == 0:
+            return {'frames': 0, 'fps': cls.fps, 'dropped_frames': cls.dropped_frames}
+
+        work_times = [work for work, _ in cls._frame_times]
+        sleep_times = [sleep for _, sleep in cls._frame_times]
+        frame_times = sorted(work + sleep for work, sleep in cls._frame_times)
+        mean_frame = sum(frame_times) / frame_count
+
+        def percentile(fraction: float) -> float:
+            return frame_times[min(frame_count - 1, int(fraction * frame_count))] * 1e3
+
+        return {'frames': frame_count,
+                'fps': cls.fps,
+                'achieved_fps': 1 / mean_frame if mean_frame > 0 else None,
+                'p50_ms': percentile(0.50),
+                'p95_ms': percentile(0.95),
+                'p99_ms': percentile(0.99),
+                'jitter_ms': (sum((frame - mean_frame) ** 2 for frame in frame_times) / frame_count) ** 0.5 * 1e3,
+                'work_ms': sum(work_times) / frame_count * 1e3,
+                'sleep_ms': sum(sleep_times) / frame_count * 1e3,
+                'work_ratio': sum(work_times) / sum(frame_times) if sum(frame_times) > 0 else 0.0,
+                'dropped_frames': cls.dropped_frames}
+
+    @classmethod
+    def reset_frame_stats(cls) -> None:
+        cls._frame_times = deque(maxlen=cls.frame_history)
+        cls.dropped_frames = 0
+        cls._adaptive_frames = 0
+        cls._tick_end = None
+
+    @classmethod
+    def set_fps(cls, fps: int | None) -> None:
+        cls.fps = fps
+        Bar.display_fps = fps if fps is not None else 60
+
+    @classmethod
+    def enable_adaptive_fps(cls, enabled: bool = True, min_fps: int | None = None, max_fps: int | None = None,
+                            window: int | None = None) -> None:
+        """Steps the frame rate down or back up towards max_fps according to the work per frame budget."""
+        if enabled and not cls.adaptive_fps:
+            cls.max_fps = max_fps if max_fps is not None else cls.max_fps if cls.max_fps is not None else cls.fps
+        elif max_fps is not None:
+            cls.max_fps = max_fps
+        if min_fps is not None:
+            cls.min_fps = min_fps
+        if window is not None:
+            cls.adaptive_window = window
+        if not enabled and cls.adaptive_fps and cls.max_fps is not None:
+            cls.set_fps(cls.max_fps)
+        cls.adaptive_fps = enabled
+        cls._adaptive_frames = 0
+
+    @classmethod
+    def adapt_fps(cls) -> None:
+        if not cls.fps or cls.max_fps is None:
+            return
+        recent = sorted(work for work, _ in list(cls._frame_times)[-cls.adaptive_window:])
+        if not recent:
+            return
+        load_time = recent[min(len(recent) - 1, int(0.95 * len(recent)))]
+        rates = sorted({rate for rate in cls.adaptive_rates if cls.min_fps <= rate <= cls.max_fps}
+                       | {cls.min_fps, cls.max_fps})
+
+        lower_rates = [rate for rate in rates if rate < cls.fps]
+        higher_rates = [rate for rate in rates if rate > cls.fps]
+        if load_time * cls.fps > cls.adaptive_lower_load and lower_rates:
+            cls.set_fps(lower_rates[-1])
+        elif higher_rates and load_time * higher_rates[0] < cls.adaptive_raise_load:
+            cls.set_fps(higher_rates[0])
+
+
+class DirtyRects:
+    enabled: ClassVar[bool] = False
+    tracking: ClassVar[bool] = False
+    padding: ClassVar[int] = 1
+    full_redraw_ratio: ClassVar[float] = 0.6
+    _rects: ClassVar[list[pygame.Rect]] = []
+    _full_redraw: ClassVar[bool] = True
+    _listeners: ClassVar[list[Callable[[object], None]]] = []
+    _changed_ids: ClassVar[set[int]] = set()
+    _changes_consumer: ClassVar[object | None] = None
+
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        cls.enabled = enabled
+        cls.tracking = cls.enabled or bool(cls._listeners)
+        cls.invalidate()
+
+    @classmethod
+    def add_listener(cls, listener: Callable[[object], None]) -> None:
+        if listener not in cls._listeners:
+            cls._listeners.append(listener)
+        cls.tracking = True
+
+    @classmethod
+    def remove_listener(cls, listener: Callable[[object], None]) -> None:
+        if listener in cls._listeners:
+            cls._listeners.remove(listener)
+        cls.tracking = cls.enabled or bool(cls._listeners)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._full_redraw = True
+        cls._rects.clear()
+        cls._changed_ids.clear()
+        cls._changes_consumer = None
+
+    @classmethod
+    def mark(cls, *rects: pygame.Rect | None) -> None:
+        for rect in rects:
+            if rect is not None and rect.width > 0 and rect.height > 0:
+                cls._rects.append(rect)
+
+    @classmethod
+    def before_change(cls, obj: object, key: str, value: object) -> pygame.Rect | None:
+        if key not in obj._dirty_attributes or key not in vars(obj) or getattr(obj, key) == value:
+            return
+        return obj.bounds
+
+    @classmethod
+    def changed(cls, obj: object, old_bounds: pygame.Rect | None = None) -> None:
+        if cls.enabled:
+            cls.mark(old_bounds, obj.bounds)
+            cls._changed_ids.add(id(obj))
+        for listener in cls._listeners:
+            listener(obj)
+
+    @classmethod
+    def take_changes(cls, consumer: object) -> set[int] | None:
+        """Ids changed since consumer last took them, or None when another consumer or invalidate() took them."""
+        changed_ids = cls._changed_ids if cls._changes_consumer is consumer else None
+        cls._changed_ids = set()
+        cls._changes_consumer = consumer
+        return changed_ids
+
+    @classmethod
+    def collect(cls, area: pygame.Rect) -> list[pygame.Rect]:
+        if cls._full_redraw:
+            cls._full_redraw = False
+            cls._rects.clear()
+            return [area.copy()]
+
+        pending = [rect.inflate(2 * cls.padding, 2 * cls.padding).clip(area) for rect in cls._rects]
+        cls._rects.clear()
+
+        merged = []
+        for rect in pending:
+            if rect.width == 0 or rect.height == 0:
+                continue
+            collision_index = rect.collidelist(merged)
+            while collision_index != -1:
+                rect = rect.union(merged.pop(collision_index))
+                collision_index = rect.collidelist(merged)
+            merged.append(rect)
+
+        if sum(rect.width * rect.height for rect in merged) > cls.full_redraw_ratio * area.width * area.height:
+            return [area.copy()]
+        return merged
+
+
+class BlitBatch:
+    _target: ClassVar[pygame.Surface | None] = None
+    _blits: ClassVar[list[tuple]] = []
+
+    @classmethod
+    def begin(cls, target: pygame.Surface) -> pygame.Surface | None:
+        """Starts collecting blits onto target. Returns the previous target to restore with end()."""
+        previous_target = cls._target
+        cls.flush()
+        cls._target = target
+        return previous_target
+
+    @classmethod
+    def end(cls, previous_target: pygame.Surface | None = None) -> None:
+        cls.flush()
+        cls._target = previous_target
+
+    @classmethod
+    def blit(cls, display: pygame.Surface, surface: pygame.Surface, position: Sequence[int],
+             area: pygame.Rect | None = None) -> None:
+        if display is cls._target:
+            cls._blits.append((surface, position) if area is None else (surface, position, area))
+        elif area is None:
+            display.blit(surface, position)
+        else:
+            display.blit(surface, position, area)
+
+    @classmethod
+    def barrier(cls, display: pygame.Surface) -> None:
+        if cls._blits and display is cls._target:
+            cls.flush()
+
+    @classmethod
+    def flush(cls) -> None:
+        if cls._blits:
+            cls._target.blits(cls._blits, doreturn=False)
+            cls._blits = []
+
+    @classmethod
+    def barrier_render(cls, render: Callable) -> Callable:
+        def render_after_flush(display: pygame.Surface) -> None:
+            cls.flush()
+            render(display)
+
+        return render_after_flush
+
+
+class RenderProfiler:
+    """Opt-in per object, class and section frame profiler with histograms and Chrome trace export."""
+    enabled: ClassVar[bool] = False
+    history: ClassVar[int] = 600
+    max_events: ClassVar[int] = 200_000
+    histogram_edges: ClassVar[tuple[float, ...]] = (1, 2, 4, 8, 16.7, 33.3, 50, 100)
+    clock: ClassVar[Callable[[], float]] = time.perf_counter
+    frames: ClassVar[deque] = deque(maxlen=600)
+    _events: ClassVar[deque] = deque(maxlen=200_000)
+    _origin: ClassVar[float] = 0.0
+    _frame_start: ClassVar[float] = 0.0
+    _frame_objects: ClassVar[dict[str, float]] = {}
+    _frame_classes: ClassVar[dict[str, float]] = {}
+    _frame_sections: ClassVar[dict[str, float]] = {}
+
+    @classmethod
+    def enable(cls, enabled: bool = True, history: int | None = None, max_events: int | None = None) -> None:
+        if history is not None:
+            cls.history = history
+        if max_events is not None:
+            cls.max_events = max_events
+        if enabled and not cls.enabled:
+            cls.clear()
+        cls.enabled = enabled
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.frames = deque(maxlen=cls.history)
+        cls._events = deque(maxlen=cls.max_events)
+        cls._origin = cls._frame_start = cls.clock()
+        cls._frame_objects, cls._frame_classes, cls._frame_sections = {}, {}, {}
+
+    @classmethod
+    def record(cls, name: str, category: str, start: float, end: float, class_name: str | None = None) -> None:
+        duration = end - start
+        if category == 'object':
+            cls._frame_objects[name] = cls._frame_objects.get(name, 0.0) + duration
+            cls._frame_classes[class_name] = cls._frame_classes.get(class_name, 0.0) + duration
+        else:
+            cls._frame_sections[name] = cls._frame_sections.get(name, 0.0) + duration
+        cls._events.append((name, category, start, duration))
+
+    @classmethod
+    def begin_frame(cls) -> None:
+        cls._frame_start = cls.clock()
+
+    @classmethod
+    def end_frame(cls, frame: int | None = None) -> None:
+        if not cls.enabled:
+            return
+        now = cls.clock()
+        frame = Frame.get() if frame is None else frame
+        cls.frames.append({'frame': frame, 'start': cls._frame_start, 'duration': now - cls._frame_start,
+                           'objects': cls._frame_objects, 'classes': cls._frame_classes,
+                           'sections': cls._frame_sections})
+        cls._events.append((f'frame {frame}', 'frame', cls._frame_start, now - cls._frame_start))
+        cls._frame_objects, cls._frame_classes, cls._frame_sections = {}, {}, {}
+        cls._frame_start = now
+
+    @classmethod
+    def section(cls, name: str) -> Callable[[Callable], Callable]:
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def profiled_section(*args, **kwargs):
+                if not cls.enabled:
+                    return func(*args, **kwargs)
+                start = cls.clock()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    cls.record(name, 'section', start, cls.clock())
+
+            return profiled_section
+
+        return decorator
+
+    @classmethod
+    def profile_render(cls, render: Callable, name: str, class_name: str) -> Callable:
+        def profiled_render(display: pygame.Surface) -> None:
+            start = cls.clock()
+            render(display)
+            BlitBatch.flush()
+            cls.record(name, 'object', start, cls.clock(), class_name)
+
+        return profiled_render
+
+    @classmethod
+    def histogram(cls, key: str | None = None) -> dict[str, int]:
+        labels = [f'<{edge}ms' for edge in cls.histogram_edges] + [f'>={cls.histogram_edges[-1]}ms']
+        counts = dict.fromkeys(labels, 0)
+        for frame in cls.frames:
+            if key is None:
+                duration = frame['duration']
+            else:
+                duration = (frame['classes'].get(key, 0.0) + frame['sections'].get(key, 0.0)
+                            + frame['objects'].get(key, 0.0))
+            for label, edge in zip(labels, cls.histogram_edges):
+                if duration * 1e3 < edge:
+                    counts[label] += 1
+                    break
+            else:
+                counts[labels[-1]] += 1
+        return counts
+
+    @classmethod
+    def summary(cls, top: int = 10) -> dict[str, object]:
+        frame_count = max(len(cls.frames), 1)
+        totals = {'classes': {}, 'sections': {}, 'objects': {}}
+        for frame in cls.frames:
+            for kind, kind_totals in totals.items():
+                for name, duration in frame[kind].items():
+                    kind_totals[name] = kind_totals.get(name, 0.0) + duration
+
+        def mean_ms(kind_totals: dict[str, float], limit: int | None = None) -> dict[str, float]:
+            ordered = sorted(kind_totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+            return {name: duration / frame_count * 1e3 for name, duration in ordered}
+
+        return {'frames': len(cls.frames),
+                'frame_ms': sum(frame['duration'] for frame in cls.frames) / frame_count * 1e3,
+                'classes': mean_ms(totals['classes']),
+                'sections': mean_ms(totals['sections']),
+                'objects': mean_ms(totals['objects'], top)}
+
+    @classmethod
+    def chrome_trace(cls, path: str | None = None) -> dict[str, object]:
+        trace = {'traceEvents': [{'name': name, 'cat': category, 'ph': 'X', 'pid': 0, 'tid': 0,
+                                  'ts': (start - cls._origin) * 1e6, 'dur': duration * 1e6}
+                                 for name, category, start, duration in cls._events],
+                 'displayTimeUnit': 'ms'}
+        if path is not None:
+            with open(path, 'w') as file:
+                json.dump(trace, file)
+        return trace
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: int = 64) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[int, object]] = {}
+        self._item_cells: dict[int, list[tuple[int, int]]] = {}
+        self._sequence: dict[int, int] = {}
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._item_cells)
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self._item_cells
+
+    def _cells_for(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        first_column, first_row = rect.x // self.cell_size, rect.y // self.cell_size
+        last_column = (rect.x + max(rect.width, 1) - 1) // self.cell_size
+        last_row = (rect.y + max(rect.height, 1) - 1) // self.cell_size
+        return [(column, row) for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)]
+
+    def insert(self, item: object, rect: pygame.Rect) -> None:
+        item_id = id(item)
+        if item_id in self._item_cells:
+            self.update(item, rect)
+            return
+
+        self._sequence[item_id] = self._next_sequence
+        self._next_sequence += 1
+        self._item_cells[item_id] = self._cells_for(rect)
+        for cell in self._item_cells[item_id]:
+            self._cells.setdefault(cell, {})[item_id] = item
+
+    def remove(self, item: object) -> None:
+        item_id = id(item)
+        for cell in self._item_cells.pop(item_id, ()):
+            cell_items = self._cells[cell]
+            del cell_items[item_id]
+            if not cell_items:
+                del self._cells[cell]
+        self._sequence.pop(item_id, None)
+
+    def update(self, item: object, rect: pygame.Rect) -> None:
+        item_id = id(item)
+        if item_id not in self._item_cells:
+            self.insert(item, rect)
+            return
+
+        new_cells = self._cells_for(rect)
+        old_cells = self._item_cells[item_id]
+        if new_cells == old_cells:
+            return
+
+        for cell in old_cells:
+            cell_items = self._cells[cell]
+            del cell_items[item_id]
+            if not cell_items:
+                del self._cells[cell]
+        for cell in new_cells:
+            self._cells.setdefault(cell, {})[item_id] = item
+        self._item_cells[item_id] = new_cells
+
+    def query_point(self, pos: Sequence[int], extra: Iterable = ()) -> list:
+        candidates = dict(self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), {}))
+        for item in extra:
+            if item is not None:
+                candidates[id(item)] = item
+        return sorted(candidates.values(), key=lambda item: self._sequence.get(id(item), -1))
+
 
 @dataclass(kw_only=True)
 class Shape:
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset(('color', 'border'))
+    _style_attributes: ClassVar[frozenset[str]] = frozenset(('color', 'border'))
+    batched_render: ClassVar[bool] = True
+
     color: T_COLOR = (0, 0, 0)
     border: int = 0
+    surface_cache: bool = False
+    _surface: pygame.Surface | None = field(default=None, repr=False, compare=False)
+    _draw_kwargs: dict[str, int | bool] | None = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, key, value) -> None:
+        old_bounds = DirtyRects.before_change(self, key, value) if DirtyRects.tracking else None
+        super().__setattr__(key, value)
+        if key in self._style_attributes:
+            self.invalidate_surface()
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
+    def invalidate_surface(self) -> None:
+        obj_vars = vars(self)
+        obj_vars['_surface'] = None
+        obj_vars['_draw_kwargs'] = None
+
+    def rasterize(self) -> pygame.Surface:
+        raise NotImplementedError
+
+    def cached_surface(self) -> pygame.Surface:
+        """The shape drawn once onto an alpha surface, to be blitted at surface_origin()."""
+        if self._surface is None:
+            vars(self)['_surface'] = self.rasterize()
+        return self._surface
+
+    def surface_origin(self) -> tuple[int, int]:
+        return self.bounds.topleft
+
+    @property
+    def bounds(self) -> pygame.Rect | None:
+        return None
+
+    def _sync_geometry(self) -> None:
+        pass
+
+    def direct_attribute(self, key: str) -> bool:
+        return not isinstance(getattr(type(self), key, None), property)
+
+    def set_attributes(self, **attributes) -> None:
+        old_bounds = self.bounds if DirtyRects.tracking else None
+        obj_vars = vars(self)
+        for key, value in attributes.items():
+            if self.direct_attribute(key):
+                obj_vars[key] = value
+            else:
+                setattr(self, key, value)
+        if not self._style_attributes.isdisjoint(attributes):
+            self.invalidate_surface()
+        self._sync_geometry()
+        if DirtyRects.tracking:
+            DirtyRects.changed(self, old_bounds)
 
     def __repr__(self) -> str:
         return f'Shape: {self.color}'
@@ -157,7 +677,13 @@ class Rect(Shape):
         Placement.BOTTOM_LEFT: 'border_bottom_left_radius',
         Placement.BOTTOM_RIGHT: 'border_bottom_right_radius'
     }
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset(('x', 'y', 'width', 'height', 'color', 'border',
+                                                             'corner_radius_all', 'corner_radius_specific'))
+    _style_attributes: ClassVar[frozenset[str]] = frozenset(('width', 'height', 'color', 'border',
+                                                             'corner_radius_all', 'corner_radius_specific'))
     _rect: pygame.Rect = field(default=None, kw_only=True)
+    _geometry_observers: list[Callable[['Rect'], None]] | None = field(default=None, kw_only=True, repr=False,
+                                                                       compare=False)
     x: int = 0
     y: int = 0
     width: int = 0
@@ -172,23 +698,64 @@ class Rect(Shape):
     def rect(self) -> pygame.Rect:
         return self._rect
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
     def __setattr__(self, key, value) -> None:
         super().__setattr__(key, value)
         if key in ['x', 'y', 'width', 'height'] and self._rect is not None:
-            self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+            self._sync_geometry()
+
+    def _sync_geometry(self) -> None:
+        self._rect.update(self.x, self.y, self.width, self.height)
+        if self._geometry_observers:
+            for observer in self._geometry_observers:
+                observer(self)
+
+    def set_geometry(self, x: int, y: int, width: int, height: int) -> None:
+        self.set_attributes(x=x, y=y, width=width, height=height)
+
+    def add_geometry_observer(self, observer: Callable[['Rect'], None]) -> None:
+        if self._geometry_observers is None:
+            self._geometry_observers = []
+        self._geometry_observers.append(observer)
+
+    def remove_geometry_observer(self, observer: Callable[['Rect'], None]) -> None:
+        if self._geometry_observers is not None and observer in self._geometry_observers:
+            self._geometry_observers.remove(observer)
+
+    @property
+    def draw_kwargs(self) -> dict[str, int]:
+        if self._draw_kwargs is None:
+            vars(self)['_draw_kwargs'] = {Rect._corner_placement_names[key]: value for key, value in
+                                          self.corner_radius_specific.items()}
+        return self._draw_kwargs
+
+    def _draw(self, display: pygame.Surface, rect: pygame.Rect) -> None:
+        if self.corner_radius_specific is None:
+            pygame.draw.rect(display, self.color, rect, self.border, self.corner_radius_all)
+        else:
+            pygame.draw.rect(display, self.color, rect, self.border, self.corner_radius_all, **self.draw_kwargs)
+
+    def rasterize(self) -> pygame.Surface:
+        surface = pygame.Surface((max(self.width, 0), max(self.height, 0)), pygame.SRCALPHA, 32)
+        self._draw(surface, pygame.Rect(0, 0, self.width, self.height))
+        return surface
+
+    def surface_origin(self) -> tuple[int, int]:
+        return self.x, self.y
 
     def render(self, display: pygame.Surface | None = None) -> None:
         display = display if display is not None else Display.window()
         if display is None:
             raise ValueError('Display argument missing')
 
-        if self.corner_radius_specific is None:
-            pygame.draw.rect(display, self.color, self.rect, self.border, self.corner_radius_all)
+        if self.surface_cache:
+            BlitBatch.blit(display, self.cached_surface(), self.surface_origin())
         else:
-            corner_radius = {Rect._corner_placement_names[key]: value for key, value in
-                             self.corner_radius_specific.items()}
-            pygame.draw.rect(display, self.color, self.rect, self.border, self.corner_radius_all,
-                             **corner_radius)
+            BlitBatch.barrier(display)
+            self._draw(display, self.rect)
 
     def __repr__(self) -> str:
         return f'Rect: ({self.x}, {self.y}) - ({self.width}, {self.height})'
@@ -204,6 +771,9 @@ class Circle(Shape):
     }
     corner_base_dict: ClassVar[dict[int, bool]] = {Placement.TOP_LEFT: True, Placement.TOP_RIGHT: True,
                                                    Placement.BOTTOM_LEFT: True, Placement.BOTTOM_RIGHT: True}
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset(('x', 'y', '_radius', 'color', 'border',
+                                                             'remove_corner_specific'))
+    _style_attributes: ClassVar[frozenset[str]] = frozenset(('_radius', 'color', 'border', 'remove_corner_specific'))
     _circle: tuple[int, int, int] = field(default=None, kw_only=True)
     x: int = 0
     y: int = 0
@@ -221,6 +791,10 @@ class Circle(Shape):
     def center(self) -> tuple[int, int]:
         return self.circle[0], self.circle[1]
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        return pygame.Rect(self.x - self._radius, self.y - self._radius, 2 * self._radius + 1, 2 * self._radius + 1)
+
     @property
     def radius(self) -> int:
         return self.circle[2]
@@ -260,21 +834,49 @@ class Circle(Shape):
     def __setattr__(self, key, value) -> None:
         super().__setattr__(key, value)
         if key in ['x', 'y', '_radius'] and self._circle is not None:
-            self._circle = (self.x, self.y, self._radius)
+            self._sync_geometry()
+
+    def _sync_geometry(self) -> None:
+        self._circle = (self.x, self.y, self._radius)
+
+    def set_geometry(self, x: int, y: int, radius: int) -> None:
+        self.set_attributes(x=x, y=y, _radius=radius)
+
+    @property
+    def draw_kwargs(self) -> dict[str, bool]:
+        if self._draw_kwargs is None:
+            draw_corners = Circle.corner_base_dict.copy()
+            draw_corners.update(self.remove_corner_specific)
+            vars(self)['_draw_kwargs'] = {Circle._corner_placement_names[key]: value for key, value in
+                                          draw_corners.items()}
+        return self._draw_kwargs
+
+    def _draw(self, display: pygame.Surface, center: tuple[int, int]) -> None:
+        if self.remove_corner_specific is None:
+            pygame.draw.circle(display, self.color, center, self.radius, self.border)
+        else:
+            pygame.draw.circle(display, self.color, center, self.radius, self.border, **self.draw_kwargs)
+
+    def rasterize(self) -> pygame.Surface:
+        origin_x, origin_y = self.surface_origin()
+        size = int(2 * self._radius + 1)
+        surface = pygame.Surface((max(size, 0), max(size, 0)), pygame.SRCALPHA, 32)
+        self._draw(surface, (self.x - origin_x, self.y - origin_y))
+        return surface
+
+    def surface_origin(self) -> tuple[int, int]:
+        return int(self.x - self._radius), int(self.y - self._radius)
 
     def render(self, display: pygame.Surface | None = None) -> None:
         display = display if display is not None else Display.window()
         if display is None:
             raise ValueError('Display argument missing')
 
-        if self.remove_corner_specific is None:
-            pygame.draw.circle(display, self.color, self.center, self.radius, self.border)
+        if self.surface_cache:
+            BlitBatch.blit(display, self.cached_surface(), self.surface_origin())
         else:
-            draw_corners = Circle.corner_base_dict.copy()
-            draw_corners.update(self.remove_corner_specific)
-            draw_corners_strings = {Circle._corner_placement_names[key]: value for key, value in draw_corners.items()}
-            pygame.draw.circle(display, self.color, self.center, self.radius, self.border,
-                               **draw_corners_strings)
+            BlitBatch.barrier(display)
+            self._draw(display, self.center)
 
     def __repr__(self) -> str:
         return f'Circle: ({self.center}) - ({self.radius})'
@@ -282,11 +884,27 @@ class Circle(Shape):
 
 @dataclass
 class Polygon(Shape):
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset(('polygon_points', 'color', 'border'))
+    _style_attributes: ClassVar[frozenset[str]] = frozenset(('polygon_points', 'color', 'border'))
     polygon_points: MutableSequence[tuple[int, int]] | None = None
 
     def __post_init__(self) -> None:
         self.polygon_points = self.polygon_points if self.polygon_points is not None else [(0, 0), (0, 0), (0, 0)]
 
+    @property
+    def bounds(self) -> pygame.Rect | None:
+        if not self.polygon_points:
+            return None
+
+        x_values = [point[0] for point in self.polygon_points]
+        y_values = [point[1] for point in self.polygon_points]
+        bounds = pygame.Rect(min(x_values), min(y_values), max(x_values) - min(x_values) + 1,
+                             max(y_values) - min(y_values) + 1)
+        return bounds.inflate(2 * self.border, 2 * self.border)
+
+    def set_geometry(self, polygon_points: MutableSequence[tuple[int, int]]) -> None:
+        self.set_attributes(polygon_points=polygon_points)
+
     def insert_point(self, coordinate: tuple[int, int], point_index: int = -1) -> None:
         if not isinstance(self.polygon_points, MutableSequence):
             raise TypeError('Polygon point insertion only possible on MutableSequence')
@@ -294,7 +912,11 @@ class Polygon(Shape):
             raise TypeError('Polygon points must be Sequence[int, int] type')
 
         if coordinate not in self.polygon_points:
+            old_bounds = self.bounds if DirtyRects.tracking else None
             self.polygon_points.insert(point_index, coordinate)
+            self.invalidate_surface()
+            if DirtyRects.tracking:
+                DirtyRects.changed(self, old_bounds)
 
     def remove_point(self, coordinate: tuple[int, int] = (0, 0)) -> int | None:
         if not isinstance(self.polygon_points, MutableSequence):
@@ -303,8 +925,12 @@ class Polygon(Shape):
             raise TypeError('Polygon points must be Sequence[int, int] type')
 
         if coordinate in self.polygon_points:
+            old_bounds = self.bounds if DirtyRects.tracking else None
             point_index = self.polygon_points.index(coordinate)
             self.polygon_points.remove(coordinate)
+            self.invalidate_surface()
+            if DirtyRects.tracking:
+                DirtyRects.changed(self, old_bounds)
             return point_index
         else:
             return
@@ -314,7 +940,25 @@ class Polygon(Shape):
         if display is None:
             raise ValueError('Display argument missing')
 
-        pygame.draw.polygon(display, self.color, self.polygon_points, self.border)
+        if self.surface_cache:
+            BlitBatch.blit(display, self.cached_surface(), self.surface_origin())
+        else:
+            BlitBatch.barrier(display)
+            pygame.draw.polygon(display, self.color, self.polygon_points, self.border)
+
+    def rasterize(self) -> pygame.Surface:
+        bounds = self.bounds
+        if bounds is None:
+            return pygame.Surface((0, 0), pygame.SRCALPHA, 32)
+
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA, 32)
+        points = [(point[0] - bounds.x, point[1] - bounds.y) for point in self.polygon_points]
+        pygame.draw.polygon(surface, self.color, points, self.border)
+        return surface
+
+    def surface_origin(self) -> tuple[int, int]:
+        bounds = self.bounds
+        return bounds.topleft if bounds is not None else (0, 0)
 
     def __repr__(self) -> str:
         return f'Polygon: ({len(self.polygon_points)} - {self.polygon_points})'
@@ -322,6 +966,8 @@ class Polygon(Shape):
 
 @dataclass
 class Ellipse(Shape):
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset(('x', 'y', 'width', 'height', 'color', 'border'))
+    _style_attributes: ClassVar[frozenset[str]] = frozenset(('width', 'height', 'color', 'border'))
     _ellipse: pygame.Rect = field(default=None, kw_only=True)
     x: int = 0
     y: int = 0
@@ -335,24 +981,696 @@ class Ellipse(Shape):
     def ellipse(self) -> pygame.Rect:
         return self._ellipse
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
     def __setattr__(self, key, value) -> None:
         super().__setattr__(key, value)
         if key in ['x', 'y', 'width', 'height'] and self._ellipse is not None:
-            self._ellipse = pygame.Rect(self.x, self.y, self.width, self.height)
+            self._sync_geometry()
+
+    def _sync_geometry(self) -> None:
+        self._ellipse.update(self.x, self.y, self.width, self.height)
+
+    def set_geometry(self, x: int, y: int, width: int, height: int) -> None:
+        self.set_attributes(x=x, y=y, width=width, height=height)
 
     def render(self, display: pygame.Surface | None = None) -> None:
         display = display if display is not None else Display.window()
         if display is None:
             raise ValueError('Display argument missing')
 
-        pygame.draw.ellipse(display, self.color, self.ellipse, self.border)
+        if self.surface_cache:
+            BlitBatch.blit(display, self.cached_surface(), self.surface_origin())
+        else:
+            BlitBatch.barrier(display)
+            pygame.draw.ellipse(display, self.color, self.ellipse, self.border)
+
+    def rasterize(self) -> pygame.Surface:
+        surface = pygame.Surface((max(self.width, 0), max(self.height, 0)), pygame.SRCALPHA, 32)
+        pygame.draw.ellipse(surface, self.color, pygame.Rect(0, 0, self.width, self.height), self.border)
+        return surface
+
+    def surface_origin(self) -> tuple[int, int]:
+        return self.x, self.y
 
     def __repr__(self) -> str:
         return f'Ellipse: ({self.x}, {self.y}) - ({self.width}, {self.height})'
 
 
+class SlottedShape:
+    """Shape variant with __slots__ instead of a per instance __dict__, for scenes with very many primitives."""
+    __slots__ = ('_color', '_border', 'surface_cache', '_surface', '_draw_kwargs')
+    _style_attributes: ClassVar[frozenset[str]] = frozenset(('color', 'border'))
+    _slot_attributes: ClassVar[frozenset[str]] = frozenset(('color', 'border'))
+    batched_render: ClassVar[bool] = True
+
+    def __init__(self, color: T_COLOR = (0, 0, 0), border: int = 0, surface_cache: bool = False) -> None:
+        self._color = color
+        self._border = border
+        self.surface_cache = surface_cache
+        self._surface = None
+        self._draw_kwargs = None
+
+    @staticmethod
+    def slot_property(slot: str, geometry: bool = False, style: bool = True) -> property:
+        name = slot[1:]
+
+        def set_slot(self, value) -> None:
+            if DirtyRects.tracking:
+                if value != getattr(self, slot):
+                    self.set_attributes(**{name: value})
+                return
+            setattr(self, slot, value)
+            if style:
+                self._surface = None
+                self._draw_kwargs = None
+            if geometry:
+                self._sync_geometry()
+
+        return property(attrgetter(slot), set_slot)
+
+    @property
+    def color(self) -> T_COLOR:
+        return self._color
+
+    @color.setter
+    def color(self, value: T_COLOR) -> None:
+        if DirtyRects.tracking:
+            if value != self._color:
+                self.set_attributes(color=value)
+            return
+        self._color = value
+        self._surface = None
+
+    @property
+    def border(self) -> int:
+        return self._border
+
+    @border.setter
+    def border(self, value: int) -> None:
+        if DirtyRects.tracking:
+            if value != self._border:
+                self.set_attributes(border=value)
+            return
+        self._border = value
+        self._surface = None
+
+    def invalidate_surface(self) -> None:
+        self._surface = None
+        self._draw_kwargs = None
+
+    def rasterize(self) -> pygame.Surface:
+        raise NotImplementedError
+
+    def cached_surface(self) -> pygame.Surface:
+        if self._surface is None:
+            self._surface = self.rasterize()
+        return self._surface
+
+    def surface_origin(self) -> tuple[int, int]:
+        return self.bounds.topleft
+
+    @property
+    def bounds(self) -> pygame.Rect | None:
+        return None
+
+    def _sync_geometry(self) -> None:
+        pass
+
+    def set_attributes(self, **attributes) -> None:
+        old_bounds = self.bounds if DirtyRects.tracking else None
+        for key, value in attributes.items():
+            setattr(self, '_' + key if key in self._slot_attributes else key, value)
+        if not self._style_attributes.isdisjoint(attributes):
+            self.invalidate_surface()
+        self._sync_geometry()
+        if DirtyRects.tracking:
+            DirtyRects.changed(self, old_bounds)
+
+
+class SlottedRect(SlottedShape):
+    __slots__ = ('_x', '_y', '_width', '_height', '_corner_radius_all', '_corner_radius_specific', '_rect',
+                 '_geometry_observers')
+    _style_attributes: ClassVar[frozenset[str]] = Rect._style_attributes
+    _slot_attributes: ClassVar[frozenset[str]] = Rect._dirty_attributes
+
+    def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0, corner_radius_all: int = 0,
+                 corner_radius_specific: dict[int, int] | None = None, *, color: T_COLOR = (0, 0, 0),
+                 border: int = 0, surface_cache: bool = False) -> None:
+        super().__init__(color, border, surface_cache)
+        self._x, self._y, self._width, self._height = x, y, width, height
+        self._corner_radius_all = corner_radius_all
+        self._corner_radius_specific = corner_radius_specific
+        self._rect = pygame.Rect(x, y, width, height)
+        self._geometry_observers = None
+
+    x = SlottedShape.slot_property('_x', geometry=True, style=False)
+    y = SlottedShape.slot_property('_y', geometry=True, style=False)
+    width = SlottedShape.slot_property('_width', geometry=True)
+    height = SlottedShape.slot_property('_height', geometry=True)
+    corner_radius_all = SlottedShape.slot_property('_corner_radius_all')
+    corner_radius_specific = SlottedShape.slot_property('_corner_radius_specific')
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._rect
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        return self._rect.copy()
+
+    def _sync_geometry(self) -> None:
+        self._rect.update(self._x, self._y, self._width, self._height)
+        if self._geometry_observers:
+            for observer in self._geometry_observers:
+                observer(self)
+
+    def set_geometry(self, x: int, y: int, width: int, height: int) -> None:
+        old_bounds = self._rect.copy() if DirtyRects.tracking else None
+        if width != self._width or height != self._height:
+            self.invalidate_surface()
+        self._x, self._y, self._width, self._height = x, y, width, height
+        self._sync_geometry()
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
+    add_geometry_observer = Rect.add_geometry_observer
+    remove_geometry_observer = Rect.remove_geometry_observer
+
+    @property
+    def draw_kwargs(self) -> dict[str, int]:
+        if self._draw_kwargs is None:
+            self._draw_kwargs = {Rect._corner_placement_names[key]: value for key, value in
+                                 self._corner_radius_specific.items()}
+        return self._draw_kwargs
+
+    _draw = Rect._draw
+    rasterize = Rect.rasterize
+    surface_origin = Rect.surface_origin
+    render = Rect.render
+
+    def __repr__(self) -> str:
+        return f'SlottedRect: ({self.x}, {self.y}) - ({self.width}, {self.height})'
+
+
+class SlottedCircle(SlottedShape):
+    __slots__ = ('_x', '_y', '_radius', '_remove_corner_specific')
+    _style_attributes: ClassVar[frozenset[str]] = Circle._style_attributes | {'radius'}
+    _slot_attributes: ClassVar[frozenset[str]] = frozenset(('x', 'y', 'radius', 'color', 'border',
+                                                            'remove_corner_specific'))
+
+    def __init__(self, x: int = 0, y: int = 0, _radius: int = 0,
+                 remove_corner_specific: dict[int, bool] | None = None, *, color: T_COLOR = (0, 0, 0),
+                 border: int = 0, surface_cache: bool = False) -> None:
+        super().__init__(color, border, surface_cache)
+        self._x, self._y, self._radius = x, y, _radius
+        self._remove_corner_specific = remove_corner_specific
+
+    x = SlottedShape.slot_property('_x', style=False)
+    y = SlottedShape.slot_property('_y', style=False)
+    radius = SlottedShape.slot_property('_radius')
+    remove_corner_specific = SlottedShape.slot_property('_remove_corner_specific')
+    diameter = Circle.diameter
+    width = Circle.width
+    height = Circle.height
+    bounds = Circle.bounds
+
+    @property
+    def circle(self) -> tuple[int, int, int]:
+        return self._x, self._y, self._radius
+
+    @property
+    def center(self) -> tuple[int, int]:
+        return self._x, self._y
+
+    def set_geometry(self, x: int, y: int, radius: int) -> None:
+        old_bounds = self.bounds if DirtyRects.tracking else None
+        if radius != self._radius:
+            self.invalidate_surface()
+        self._x, self._y, self._radius = x, y, radius
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
+    @property
+    def draw_kwargs(self) -> dict[str, bool]:
+        if self._draw_kwargs is None:
+            draw_corners = Circle.corner_base_dict.copy()
+            draw_corners.update(self._remove_corner_specific)
+            self._draw_kwargs = {Circle._corner_placement_names[key]: value for key, value in draw_corners.items()}
+        return self._draw_kwargs
+
+    _draw = Circle._draw
+    rasterize = Circle.rasterize
+    surface_origin = Circle.surface_origin
+    render = Circle.render
+
+    def __repr__(self) -> str:
+        return f'SlottedCircle: ({self.center}) - ({self.radius})'
+
+
+class SlottedPolygon(SlottedShape):
+    __slots__ = ('_polygon_points',)
+    _style_attributes: ClassVar[frozenset[str]] = Polygon._style_attributes
+    _slot_attributes: ClassVar[frozenset[str]] = Polygon._dirty_attributes
+
+    def __init__(self, polygon_points: MutableSequence[tuple[int, int]] | None = None, *,
+                 color: T_COLOR = (0, 0, 0), border: int = 0, surface_cache: bool = False) -> None:
+        super().__init__(color, border, surface_cache)
+        self._polygon_points = polygon_points if polygon_points is not None else [(0, 0), (0, 0), (0, 0)]
+
+    polygon_points = SlottedShape.slot_property('_polygon_points')
+    bounds = Polygon.bounds
+
+    def set_geometry(self, polygon_points: MutableSequence[tuple[int, int]]) -> None:
+        self.set_attributes(polygon_points=polygon_points)
+
+    insert_point = Polygon.insert_point
+    remove_point = Polygon.remove_point
+    rasterize = Polygon.rasterize
+    surface_origin = Polygon.surface_origin
+    render = Polygon.render
+
+    def __repr__(self) -> str:
+        return f'SlottedPolygon: ({len(self.polygon_points)} - {self.polygon_points})'
+
+
+class SlottedEllipse(SlottedShape):
+    __slots__ = ('_x', '_y', '_width', '_height', '_rect')
+    _style_attributes: ClassVar[frozenset[str]] = Ellipse._style_attributes
+    _slot_attributes: ClassVar[frozenset[str]] = Ellipse._dirty_attributes
+
+    def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0, *, color: T_COLOR = (0, 0, 0),
+                 border: int = 0, surface_cache: bool = False) -> None:
+        super().__init__(color, border, surface_cache)
+        self._x, self._y, self._width, self._height = x, y, width, height
+        self._rect = pygame.Rect(x, y, width, height)
+
+    x = SlottedShape.slot_property('_x', geometry=True, style=False)
+    y = SlottedShape.slot_property('_y', geometry=True, style=False)
+    width = SlottedShape.slot_property('_width', geometry=True)
+    height = SlottedShape.slot_property('_height', geometry=True)
+
+    @property
+    def ellipse(self) -> pygame.Rect:
+        return self._rect
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        return self._rect.copy()
+
+    def _sync_geometry(self) -> None:
+        self._rect.update(self._x, self._y, self._width, self._height)
+
+    def set_geometry(self, x: int, y: int, width: int, height: int) -> None:
+        old_bounds = self._rect.copy() if DirtyRects.tracking else None
+        if width != self._width or height != self._height:
+            self.invalidate_surface()
+        self._x, self._y, self._width, self._height = x, y, width, height
+        self._sync_geometry()
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
+    rasterize = Ellipse.rasterize
+    surface_origin = Ellipse.surface_origin
+    render = Ellipse.render
+
+    def __repr__(self) -> str:
+        return f'SlottedEllipse: ({self.x}, {self.y}) - ({self.width}, {self.height})'
+
+
+class FontPool:
+    max_fonts: ClassVar[int] = 256
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+    evictions: ClassVar[int] = 0
+    _fonts: ClassVar[OrderedDict] = OrderedDict()
+    _font_paths: ClassVar[dict[tuple[str, bool, bool], tuple[str | None, bool, bool]]] = {}
+
+    @classmethod
+    def resolve(cls, font: str, bold: bool = False, italic: bool = False) -> tuple[str | None, bool, bool]:
+        key = (font, bold, italic)
+        if key not in cls._font_paths:
+            cls._font_paths[key] = pygame.font.SysFont(font, 1, bold, italic,
+                                                       constructor=lambda path, size, b, i: (path, b, i))
+        return cls._font_paths[key]
+
+    @classmethod
+    def preload(cls, fonts: Iterable[str], styles: Iterable[tuple[bool, bool]] = ((False, False),)) -> None:
+        styles = tuple(styles)
+        for font in fonts:
+            for bold, italic in styles:
+                cls.resolve(font, bold, italic)
+
+    @classmethod
+    def get(cls, font: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        key = (font, size, bold, italic)
+        font_obj = cls._fonts.get(key)
+        if font_obj is not None:
+            cls.hits += 1
+            cls._fonts.move_to_end(key)
+            return font_obj
+
+        cls.misses += 1
+        font_obj = cls._fonts[key] = cls.create(font, size, bold, italic)
+        while len(cls._fonts) > cls.max_fonts:
+            cls._fonts.popitem(last=False)
+            cls.evictions += 1
+        return font_obj
+
+    @classmethod
+    def peek(cls, font: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font | None:
+        return cls._fonts.get((font, size, bold, italic))
+
+    @classmethod
+    def create(cls, font: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        path, set_bold, set_italic = cls.resolve(font, bold, italic)
+        font_obj = pygame.font.Font(path, size)
+        if set_bold:
+            font_obj.set_bold(True)
+        if set_italic:
+            font_obj.set_italic(True)
+        return font_obj
+
+    @classmethod
+    def clear(cls, reset_stats: bool = False) -> None:
+        cls._fonts.clear()
+        if reset_stats:
+            cls.hits = cls.misses = cls.evictions = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {'size': len(cls._fonts), 'max_fonts': cls.max_fonts, 'resolved_paths': len(cls._font_paths),
+                'hits': cls.hits, 'misses': cls.misses, 'evictions': cls.evictions}
+
+
+class FontFitter:
+    default_font_size: ClassVar[int] = 300
+    max_font_size: ClassVar[int] = 1000
+    max_entries: ClassVar[int] = 4096
+    max_probe_fonts: ClassVar[int] = 128
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+    _fits: ClassVar[OrderedDict] = OrderedDict()
+    _probe_fonts: ClassVar[OrderedDict] = OrderedDict()
+
+    @classmethod
+    def probe_font(cls, font: str, size: int, bold: bool, italic: bool) -> pygame.font.Font:
+        """Font for measuring a candidate size, kept out of FontPool so probing does not evict fonts in use."""
+        font_obj = FontPool.peek(font, size, bold, italic)
+        if font_obj is not None:
+            return font_obj
+
+        key = (font, size, bold, italic)
+        font_obj = cls._probe_fonts.get(key)
+        if font_obj is None:
+            font_obj = cls._probe_fonts[key] = FontPool.create(font, size, bold, italic)
+            while len(cls._probe_fonts) > cls.max_probe_fonts:
+                cls._probe_fonts.popitem(last=False)
+        else:
+            cls._probe_fonts.move_to_end(key)
+        return font_obj
+
+    @classmethod
+    def fits(cls, text: str, font: str, size: int, bold: bool, italic: bool, max_width: int | None,
+             max_height: int | None) -> bool:
+        text_width, text_height = cls.probe_font(font, size, bold, italic).size(text)
+        if max_width is not None and text_width > max_width:
+            return False
+        if max_height is not None and text_height > max_height:
+            return False
+        return True
+
+    @classmethod
+    def fit(cls, text: str, font: str, bold: bool = False, italic: bool = False, max_width: int | None = None,
+            max_height: int | None = None, margin: int = 0, fallback_size: int | None = None) -> int:
+        fallback_size = cls.default_font_size if fallback_size is None else fallback_size
+        if max_width is None and max_height is None or text == '' and max_height is None:
+            return fallback_size
+
+        key = (text, font, bold, italic, max_width, max_height, margin)
+        font_size = cls._fits.get(key)
+        if font_size is not None:
+            cls.hits += 1
+            cls._fits.move_to_end(key)
+            return font_size
+
+        cls.misses += 1
+        width_limit = max_width - margin if max_width is not None and text != '' else None
+        height_limit = max_height - margin if max_height is not None else None
+
+        low, high = 1, 8
+        while high < cls.max_font_size and cls.fits(text, font, high, bold, italic, width_limit, height_limit):
+            low, high = high, min(high * 2, cls.max_font_size)
+
+        if cls.fits(text, font, high, bold, italic, width_limit, height_limit):
+            low = high
+        else:
+            while high - low > 1:
+                middle = (low + high) // 2
+                if cls.fits(text, font, middle, bold, italic, width_limit, height_limit):
+                    low = middle
+                else:
+                    high = middle
+
+        cls._fits[key] = low
+        while len(cls._fits) > cls.max_entries:
+            cls._fits.popitem(last=False)
+        return low
+
+    @classmethod
+    def clear(cls, reset_stats: bool = False) -> None:
+        cls._fits.clear()
+        cls._probe_fonts.clear()
+        if reset_stats:
+            cls.hits = cls.misses = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {'size': len(cls._fits), 'max_entries': cls.max_entries, 'hits': cls.hits, 'misses': cls.misses}
+
+
+class TextSurfaceCache:
+    max_size: ClassVar[int] = 512
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+    evictions: ClassVar[int] = 0
+    _surfaces: ClassVar[OrderedDict] = OrderedDict()
+
+    @classmethod
+    def get(cls, font_obj: pygame.font.Font, text: str, font: str, size: int, bold: bool, italic: bool,
+            color: T_COLOR, antialias: bool = True) -> pygame.Surface:
+        key = (text, font, size, bold, italic, tuple(color), antialias)
+        surface = cls._surfaces.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls._surfaces.move_to_end(key)
+            return surface
+
+        cls.misses += 1
+        surface = font_obj.render(text, antialias, color)
+        cls._surfaces[key] = surface
+        while len(cls._surfaces) > cls.max_size:
+            cls._surfaces.popitem(last=False)
+            cls.evictions += 1
+        return surface
+
+    @classmethod
+    def resize(cls, max_size: int) -> None:
+        cls.max_size = max_size
+        while len(cls._surfaces) > cls.max_size:
+            cls._surfaces.popitem(last=False)
+            cls.evictions += 1
+
+    @classmethod
+    def clear(cls, reset_stats: bool = False) -> None:
+        cls._surfaces.clear()
+        if reset_stats:
+            cls.hits = cls.misses = cls.evictions = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {'size': len(cls._surfaces), 'max_size': cls.max_size, 'hits': cls.hits, 'misses': cls.misses,
+                'evictions': cls.evictions}
+
+
+class ParagraphLayout:
+    """Word wrapped layout of a multi-line text that re-wraps and redraws from the first changed paragraph."""
+    max_runs: ClassVar[int] = 16384
+    max_paragraphs: ClassVar[int] = 4096
+    _run_widths: ClassVar[OrderedDict] = OrderedDict()
+    _breaks: ClassVar[OrderedDict] = OrderedDict()
+
+    def __init__(self) -> None:
+        self.layout_key: tuple | None = None
+        self.paragraphs: list[str] = []
+        self.paragraph_starts: list[int] = []
+        self.lines: list[str] = []
+        self.line_widths: list[int] = []
+        self._surface: pygame.Surface | None = None
+        self._surface_key: tuple | None = None
+        self._surface_lines: list[str] = []
+        self._surface_start = 0
+
+    @classmethod
+    def run_width(cls, font_obj: pygame.font.Font, font_key: tuple, run: str) -> int:
+        key = (font_key, run)
+        width = cls._run_widths.get(key)
+        if width is None:
+            width = cls._run_widths[key] = font_obj.size(run)[0]
+            while len(cls._run_widths) > cls.max_runs:
+                cls._run_widths.popitem(last=False)
+        else:
+            cls._run_widths.move_to_end(key)
+        return width
+
+    @staticmethod
+    def fitting_prefix(run: str, font_obj: pygame.font.Font, max_width: int) -> int:
+        low, high = 0, len(run)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font_obj.size(run[:middle])[0] <= max_width:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    @classmethod
+    def wrap(cls, paragraph: str, font_obj: pygame.font.Font, font_key: tuple,
+             max_width: int) -> tuple[tuple[str, ...], tuple[int, ...]]:
+        key = (font_key, max_width, paragraph)
+        wrapped = cls._breaks.get(key)
+        if wrapped is not None:
+            cls._breaks.move_to_end(key)
+            return wrapped
+
+        lines: list[str] = []
+        line, line_width = '', 0
+        for run in re.findall(r'\S+|\s+', paragraph):
+            run_width = cls.run_width(font_obj, font_key, run)
+            if run.isspace():
+                if line or not lines:
+                    line, line_width = line + run, line_width + run_width
+                continue
+
+            if line_width + run_width > max_width and line.strip():
+                lines.append(line.rstrip())
+                line, line_width = '', 0
+            while run_width > max_width - line_width and len(run) > 1:
+                cut = cls.fitting_prefix(run, font_obj, max_width - line_width)
+                if cut == 0 and line:
+                    lines.append(line.rstrip())
+                    line, line_width = '', 0
+                    continue
+                lines.append(line + run[:max(cut, 1)])
+                line, line_width = '', 0
+                run = run[max(cut, 1):]
+                run_width = cls.run_width(font_obj, font_key, run)
+            line, line_width = line + run, line_width + run_width
+        lines.append(line.rstrip() if lines else line)
+
+        wrapped = tuple(lines), tuple(font_obj.size(line)[0] for line in lines)
+        cls._breaks[key] = wrapped
+        while len(cls._breaks) > cls.max_paragraphs:
+            cls._breaks.popitem(last=False)
+        return wrapped
+
+    @classmethod
+    def fit_font_size(cls, text: str, font: str, bold: bool, italic: bool, max_width: int, max_height: int,
+                      spacing_factor: float) -> int:
+        def fits(size: int) -> bool:
+            font_obj = FontFitter.probe_font(font, size, bold, italic)
+            line_count = sum(len(cls.wrap(paragraph, font_obj, (font, size, bold, italic), max_width)[0])
+                             for paragraph in text.split('\n'))
+            return line_count * int(size * spacing_factor) <= max_height
+
+        low, high = 1, FontFitter.max_font_size
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def update(self, text: str, font_obj: pygame.font.Font, font_key: tuple, max_width: int) -> int:
+        layout_key = (font_key, max_width)
+        if layout_key != self.layout_key:
+            self.layout_key = layout_key
+            self.paragraphs, self.paragraph_starts, self.lines, self.line_widths = [], [], [], []
+
+        paragraphs = text.split('\n')
+        first = 0
+        common = min(len(self.paragraphs), len(paragraphs))
+        while first < common and self.paragraphs[first] == paragraphs[first]:
+            first += 1
+        if first == len(self.paragraphs) == len(paragraphs):
+            return len(self.lines)
+
+        first_line = self.paragraph_starts[first] if first < len(self.paragraph_starts) else len(self.lines)
+        del self.lines[first_line:], self.line_widths[first_line:], self.paragraph_starts[first:]
+        for paragraph in paragraphs[first:]:
+            self.paragraph_starts.append(len(self.lines))
+            lines, line_widths = ParagraphLayout.wrap(paragraph, font_obj, font_key, max_width)
+            self.lines.extend(lines)
+            self.line_widths.extend(line_widths)
+        self.paragraphs = paragraphs
+        return first_line
+
+    def surface(self, text: str, font_obj: pygame.font.Font, font_key: tuple, max_width: int, line_height: int,
+                color: T_COLOR, antialias: bool, x_align: int, first_line: int | None = 0,
+                max_lines: int | None = None) -> pygame.Surface:
+        """The visible lines drawn onto one alpha surface, keeping the lines already drawn on it."""
+        self.update(text, font_obj, font_key, max_width)
+        line_count = len(self.lines)
+        if first_line is None:
+            start = max(line_count - max_lines, 0) if max_lines is not None else 0
+        else:
+            start = max(min(first_line, line_count - 1), 0)
+        end = line_count if max_lines is None else min(line_count, start + max_lines)
+        visible_lines = self.lines[start:end]
+        size = (max_width, max(len(visible_lines), 1) * line_height)
+
+        surface_key = (font_key, line_height, tuple(color), antialias, x_align, size)
+        if surface_key != self._surface_key:
+            self._surface_key = surface_key
+            self._surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+            self._surface_lines = []
+        elif 0 < start - self._surface_start < len(self._surface_lines):
+            self._surface.scroll(0, (self._surface_start - start) * line_height)
+            self._surface_lines = self._surface_lines[start - self._surface_start:]
+        self._surface_start = start
+
+        redraw_from = 0
+        common = min(len(self._surface_lines), len(visible_lines))
+        while redraw_from < common and self._surface_lines[redraw_from] == visible_lines[redraw_from]:
+            redraw_from += 1
+        if redraw_from == len(self._surface_lines) == len(visible_lines):
+            return self._surface
+
+        self._surface.fill((0, 0, 0, 0), (0, redraw_from * line_height, size[0], size[1]))
+        line_blits = []
+        for n_line, line in enumerate(visible_lines[redraw_from:], redraw_from):
+            if not line:
+                continue
+            line_render = TextSurfaceCache.get(font_obj, line, *font_key, color, antialias)
+            match x_align:
+                case Placement.CENTER:
+                    line_x = (max_width - line_render.get_width()) // 2
+                case Placement.RIGHT:
+                    line_x = max_width - line_render.get_width()
+                case _:
+                    line_x = 0
+            line_blits.append((line_render, (line_x, n_line * line_height), None, pygame.BLEND_RGBA_MAX))
+        self._surface.blits(line_blits, doreturn=False)
+        self._surface_lines = visible_lines
+        return self._surface
+
+
 @dataclass
 class Text:
+    batched_render: ClassVar[bool] = True
     _text: str = ''
     x: int = 0
     y: int = 0
@@ -368,12 +1686,32 @@ class Text:
     margin: int = 20
     dynamic_multi_line: bool = False
     multi_line_splitted: MutableSequence['Text'] | None = None
+    antialias: bool = field(default=True, kw_only=True)
+    word_wrap: bool = field(default=False, kw_only=True)
+    first_line: int | None = field(default=0, kw_only=True)
+    _blit_key: tuple | None = field(default=None, kw_only=True, repr=False, compare=False)
+    _blit_position: tuple[int, int] | None = field(default=None, kw_only=True, repr=False, compare=False)
+    _paragraph: ParagraphLayout | None = field(default=None, kw_only=True, repr=False, compare=False)
 
     multi_line_height_factor: ClassVar[int] = 0.75
     multi_line_spacing_factor: ClassVar[int] = 1.4
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset((
+        '_text', 'x', 'y', 'color', 'font', 'font_size', 'bold', 'italic', 'alignment', '_text_font_processed',
+        'resize_max_width', 'resize_max_height', 'margin', 'antialias', 'first_line'))
 
     def __post_init__(self) -> None:
-        if self.dynamic_multi_line:
+        if self.word_wrap:
+            if self.dynamic_multi_line:
+                raise ValueError('Use either word_wrap or dynamic_multi_line')
+            if self.resize_max_width is None or (self.font_size is None and self.resize_max_height is None):
+                raise ValueError('Provide resize_max_width and either font_size or resize_max_height to use word wrap')
+
+            self._paragraph = ParagraphLayout()
+            if self.font_size is None:
+                self.font_size = self.auto_size_font(resize=False)
+            self.update_font()
+
+        elif self.dynamic_multi_line:
             if None in [self.resize_max_width, self.resize_max_height]:
                 raise ValueError('Provide resize_max_width and resize_max_height arguments to use dynamic multilines')
 
@@ -396,28 +1734,34 @@ class Text:
 
         else:
             if self.font_size is None:
-                self.font_size = 300
-                self.update_font()
-                self.auto_size_font()
+                self.font_size = self.auto_size_font(resize=False)
             self.update_font()
 
     def auto_size_font(self, resize: bool = True) -> int:
-        temp_text = self._text_font_processed.render(self.text, True, self.color)
-
-        size_factor_w = size_factor_h = 1
-        if self.resize_max_width is not None and temp_text.get_width() != 0:
-            size_factor_w = (self.resize_max_width - self.margin) / temp_text.get_width()
-        if self.resize_max_height is not None and temp_text.get_height() != 0:
-            size_factor_h = (self.resize_max_height - self.margin) / temp_text.get_height()
+        if self.word_wrap:
+            font_size = ParagraphLayout.fit_font_size(self.text, self.font, self.bold, self.italic, self.wrap_width,
+                                                      self.resize_max_height - self.margin,
+                                                      Text.multi_line_spacing_factor)
+            if resize:
+                self.font_size = font_size
+                self.update_font()
+            return font_size
 
-        font_size = int(self.font_size * min(size_factor_w, size_factor_h))
+        font_size = FontFitter.fit(self.text, self.font, self.bold, self.italic, self.resize_max_width,
+                                   self.resize_max_height, self.margin, self.font_size)
         if resize:
             self.font_size = font_size
             self.update_font()
         return font_size
 
+    def __setattr__(self, key, value) -> None:
+        old_bounds = DirtyRects.before_change(self, key, value) if DirtyRects.tracking else None
+        super().__setattr__(key, value)
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
     def update_font(self) -> None:
-        self._text_font_processed = pygame.font.SysFont(self.font, self.font_size, self.bold, self.italic)
+        self._text_font_processed = FontPool.get(self.font, self.font_size, self.bold, self.italic)
 
     @property
     def text(self) -> str:
@@ -428,6 +1772,8 @@ class Text:
         if isinstance(value, str):
             self._text = value
 
+            if self.word_wrap:
+                return
             if self.resize_max_width is not None or self.resize_max_height is not None:
                 self.auto_size_font()
         else:
@@ -437,6 +1783,92 @@ class Text:
     def text_size_rect(self) -> Rect:
         return Rect(self.x, self.y, self.resize_max_width, self.resize_max_height)
 
+    @property
+    def wrap_width(self) -> int:
+        return self.resize_max_width - self.margin
+
+    @property
+    def line_height(self) -> int:
+        return int(self.font_size * Text.multi_line_spacing_factor)
+
+    @property
+    def text_surface(self) -> pygame.Surface:
+        if self.word_wrap:
+            max_lines = None
+            if self.resize_max_height is not None:
+                max_lines = max((self.resize_max_height - self.margin) // self.line_height, 1)
+            return self._paragraph.surface(self.text, self._text_font_processed,
+                                           (self.font, self.font_size, self.bold, self.italic), self.wrap_width,
+                                           self.line_height, self.color, self.antialias,
+                                           Placement.split(self.alignment)[0], self.first_line, max_lines)
+
+        return TextSurfaceCache.get(self._text_font_processed, self.text, self.font, self.font_size, self.bold,
+                                    self.italic, self.color, self.antialias)
+
+    @property
+    def parts(self) -> tuple:
+        return tuple(self.multi_line_splitted) if self.multi_line_splitted is not None else ()
+
+    @property
+    def bounds(self) -> pygame.Rect | None:
+        if self.dynamic_multi_line:
+            if not self.multi_line_splitted:
+                return None
+            return self.multi_line_splitted[0].bounds.unionall([text_obj.bounds
+                                                                for text_obj in self.multi_line_splitted[1:]])
+
+        if self._text_font_processed is None:
+            return None
+        text_size = self.text_surface.get_size() if self.word_wrap else self._text_font_processed.size(self.text)
+        return pygame.Rect(self.blit_position(text_size), text_size)
+
+    def blit_position(self, text_size: tuple[int, int]) -> tuple[int, int]:
+        blit_key = (self.x, self.y, self.alignment, self.resize_max_width, self.resize_max_height, self.margin,
+                    text_size)
+        if blit_key == self._blit_key:
+            return self._blit_position
+
+        text_width, text_height = text_size
+        x_align, y_align = Placement.split(self.alignment)
+
+        if y_align not in (Placement.TOP, Placement.TOP_OUT) and self.resize_max_height is None:
+            y_align = Placement.TOP
+
+        match y_align:
+            case Placement.CENTER:
+                text_y = self.y + (self.resize_max_height - text_height) // 2
+            case Placement.TOP:
+                text_y = self.y + self.margin // 2
+            case Placement.BOTTOM:
+                text_y = self.y + self.resize_max_height - text_height - self.margin // 2
+            case Placement.TOP_OUT:
+                text_y = self.y - text_height - self.margin // 2
+            case Placement.BOTTOM_OUT:
+                text_y = self.y + self.resize_max_height + text_height + self.margin // 2
+            case _:
+                raise NotImplementedError("Unusable text alignment")
+
+        if x_align not in (Placement.LEFT, Placement.LEFT_OUT) and self.resize_max_width is None:
+            x_align = Placement.LEFT
+
+        match x_align:
+            case Placement.CENTER:
+                text_x = self.x + (self.resize_max_width - text_width) // 2
+            case Placement.LEFT:
+                text_x = self.x + self.margin // 2
+            case Placement.RIGHT:
+                text_x = self.x + self.resize_max_width - text_width - self.margin // 2
+            case Placement.LEFT_OUT:
+                text_x = self.x - text_width - self.margin // 2
+            case Placement.RIGHT_OUT:
+                text_x = self.x + self.resize_max_width + text_width + self.margin // 2
+            case _:
+                raise NotImplementedError("Unusable text alignment")
+
+        self._blit_key = blit_key
+        self._blit_position = (text_x, text_y)
+        return self._blit_position
+
     def render(self, display: pygame.Surface | None = None) -> None:
         display = display if display is not None else Display.window()
         if display is None:
@@ -447,54 +1879,260 @@ class Text:
                 text_obj.render(display)
 
         else:
-            text_render = self._text_font_processed.render(self.text, True, self.color)
-            x_align, y_align = Placement.split(self.alignment)
+            text_render = self.text_surface
+            BlitBatch.blit(display, text_render, self.blit_position(text_render.get_size()))
 
-            if y_align not in (Placement.TOP, Placement.TOP_OUT) and self.resize_max_height is None:
-                y_align = Placement.TOP
+    def __repr__(self):
+        return f'"{self.text}", ({self.x}, {self.y}), {self.color}, size={self.font_size}'
 
-            match y_align:
-                case Placement.CENTER:
-                    text_y = self.y + (self.resize_max_height - text_render.get_height()) // 2
-                case Placement.TOP:
-                    text_y = self.y + self.margin // 2
-                case Placement.BOTTOM:
-                    text_y = self.y + self.resize_max_height - text_render.get_height() - self.margin // 2
-                case Placement.TOP_OUT:
-                    text_y = self.y - text_render.get_height() - self.margin // 2
-                case Placement.BOTTOM_OUT:
-                    text_y = self.y + self.resize_max_height + text_render.get_height() + self.margin // 2
-                case _:
-                    raise NotImplementedError("Unusable text alignment")
 
-            if x_align not in (Placement.LEFT, Placement.LEFT_OUT) and self.resize_max_width is None:
-                x_align = Placement.LEFT
+class GapBuffer:
+    """Text buffer with a gap at the edit position and summed advance widths on both sides of it."""
+    def __init__(self, text: str = '', advances: Sequence[int] = ()) -> None:
+        self._before: list[str] = list(text)
+        self._before_advances: list[int] = list(advances)
+        self._after: list[str] = []
+        self._after_advances: list[int] = []
+        self.before_width = sum(self._before_advances)
+        self.after_width = 0
+        self.version = 0
+        self._text: str | None = text
 
-            match x_align:
-                case Placement.CENTER:
-                    text_x = self.x + (self.resize_max_width - text_render.get_width()) // 2
-                case Placement.LEFT:
-                    text_x = self.x + self.margin // 2
-                case Placement.RIGHT:
-                    text_x = self.x + self.resize_max_width - text_render.get_width() - self.margin // 2
-                case Placement.LEFT_OUT:
-                    text_x = self.x - text_render.get_width() - self.margin // 2
-                case Placement.RIGHT_OUT:
-                    text_x = self.x + self.resize_max_width + text_render.get_width() + self.margin // 2
-                case _:
-                    raise NotImplementedError("Unusable text alignment")
+    def __len__(self) -> int:
+        return len(self._before) + len(self._after)
 
-            display.blit(text_render, (text_x, text_y))
+    @property
+    def gap(self) -> int:
+        return len(self._before)
 
-    def __repr__(self):
-        return f'"{self.text}", ({self.x}, {self.y}), {self.color}, size={self.font_size}'
+    @property
+    def width(self) -> int:
+        return self.before_width + self.after_width
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = ''.join(self._before) + ''.join(reversed(self._after))
+        return self._text
+
+    def _changed(self) -> None:
+        self._text = None
+        self.version += 1
+
+    def move_gap(self, position: int) -> None:
+        position = max(0, min(position, len(self)))
+        gap = len(self._before)
+        if position < gap:
+            moved, moved_advances = self._before[position:], self._before_advances[position:]
+            del self._before[position:], self._before_advances[position:]
+            self._after.extend(reversed(moved))
+            self._after_advances.extend(reversed(moved_advances))
+            moved_width = sum(moved_advances)
+            self.before_width -= moved_width
+            self.after_width += moved_width
+        elif position > gap:
+            count = position - gap
+            moved, moved_advances = self._after[-count:], self._after_advances[-count:]
+            del self._after[-count:], self._after_advances[-count:]
+            self._before.extend(reversed(moved))
+            self._before_advances.extend(reversed(moved_advances))
+            moved_width = sum(moved_advances)
+            self.before_width += moved_width
+            self.after_width -= moved_width
+
+    def insert(self, text: str, advances: Sequence[int]) -> None:
+        self._before.extend(text)
+        self._before_advances.extend(advances)
+        self.before_width += sum(advances)
+        self._changed()
+
+    def delete_before(self, count: int) -> str:
+        count = min(count, len(self._before))
+        if count <= 0:
+            return ''
+        removed = ''.join(self._before[-count:])
+        self.before_width -= sum(self._before_advances[-count:])
+        del self._before[-count:], self._before_advances[-count:]
+        self._changed()
+        return removed
+
+    def delete_after(self, count: int) -> str:
+        count = min(count, len(self._after))
+        if count <= 0:
+            return ''
+        removed = ''.join(reversed(self._after[-count:]))
+        self.after_width -= sum(self._after_advances[-count:])
+        del self._after[-count:], self._after_advances[-count:]
+        self._changed()
+        return removed
+
+    def slice(self, start: int, end: int) -> str:
+        gap = len(self._before)
+        before = ''.join(self._before[start:min(end, gap)]) if start < gap else ''
+        if end <= gap:
+            return before
+        after_start, after_end = max(start - gap, 0), end - gap
+        size = len(self._after)
+        return before + ''.join(reversed(self._after[max(size - after_end, 0):size - after_start]))
+
+    def x_of(self, position: int) -> int:
+        gap = len(self._before)
+        if position <= gap:
+            return self.before_width - sum(self._before_advances[max(position, 0):])
+        count = min(position - gap, len(self._after))
+        return self.before_width + sum(self._after_advances[len(self._after) - count:])
+
+    def span_around_gap(self, left: int, right: int) -> tuple[int, int, int]:
+        """Start and end index of the characters between the x positions left and right, and the start x."""
+        before, after = self._before_advances, self._after_advances
+        start, start_x = len(before), self.before_width
+        while start > 0 and start_x > left:
+            start -= 1
+            start_x -= before[start]
+
+        end_index, end_x = len(after), self.before_width
+        while end_index > 0 and end_x < right:
+            end_index -= 1
+            end_x += after[end_index]
+        return start, len(before) + len(after) - end_index, start_x
+
+    def advances(self) -> list[int]:
+        return self._before_advances + self._after_advances[::-1]
+
+
+class TextEditor:
+    """Editing core of an incremental InputField: a GapBuffer with cursor, selection and scrolling."""
+    advance_cache: ClassVar[dict[tuple, dict[str, int]]] = {}
+
+    def __init__(self, font_key: tuple[str, int, bool, bool], text: str = '', mask: str | None = None) -> None:
+        self.font_key = font_key
+        self.mask = mask
+        self.anchor: int | None = None
+        self.scroll_x = 0
+        self.buffer = GapBuffer(text, self.measure(text))
+        self._span_key: tuple | None = None
+        self._span: tuple[int, int, int] = (0, 0, 0)
+
+    @property
+    def font(self) -> pygame.font.Font:
+        return FontPool.get(*self.font_key)
+
+    @property
+    def text(self) -> str:
+        return self.buffer.text
+
+    @property
+    def cursor(self) -> int:
+        return self.buffer.gap
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def measure(self, text: str) -> list[int]:
+        advances = TextEditor.advance_cache.setdefault(self.font_key, {})
+        if self.mask is not None:
+            text = self.mask * len(text)
+        missing = ''.join(set(text).difference(advances))
+        if missing:
+            font = self.font
+            for char, metrics in zip(missing, font.metrics(missing)):
+                advances[char] = metrics[4] if metrics is not None else font.size(char)[0]
+        return [advances[char] for char in text]
+
+    def set_text(self, text: str) -> None:
+        self.buffer = GapBuffer(text, self.measure(text))
+        self.anchor = None
+        self.scroll_x = 0
+
+    def set_font(self, font_key: tuple[str, int, bool, bool]) -> None:
+        if font_key != self.font_key:
+            self.font_key = font_key
+            cursor = self.cursor
+            self.set_text(self.text)
+            self.buffer.move_gap(cursor)
+
+    @property
+    def selection(self) -> tuple[int, int] | None:
+        if self.anchor is None or self.anchor == self.cursor:
+            return None
+        return min(self.anchor, self.cursor), max(self.anchor, self.cursor)
+
+    @property
+    def selected_text(self) -> str:
+        selection = self.selection
+        return self.buffer.slice(*selection) if selection is not None else ''
+
+    def move(self, position: int, select: bool = False) -> None:
+        if select and self.anchor is None:
+            self.anchor = self.cursor
+        elif not select:
+            self.anchor = None
+        self.buffer.move_gap(position)
+
+    def select_all(self) -> None:
+        self.buffer.move_gap(len(self.buffer))
+        self.anchor = 0
+
+    def delete_selection(self) -> str:
+        selection = self.selection
+        self.anchor = None
+        if selection is None:
+            return ''
+        start, end = selection
+        self.buffer.move_gap(start)
+        return self.buffer.delete_after(end - start)
+
+    def insert(self, text: str) -> None:
+        self.delete_selection()
+        if text:
+            self.buffer.insert(text, self.measure(text))
+
+    def delete(self, backward: bool = True) -> str:
+        if self.selection is not None:
+            return self.delete_selection()
+        self.anchor = None
+        return self.buffer.delete_before(1) if backward else self.buffer.delete_after(1)
+
+    def position_at(self, x: int) -> int:
+        position = 0
+        for advance in self.buffer.advances():
+            if x < advance / 2:
+                break
+            x -= advance
+            position += 1
+        return position
+
+    def visible_span(self, width: int) -> tuple[int, int, int]:
+        """Scrolls the cursor into view and returns the visible start and end index and the start x."""
+        cursor_x = self.buffer.before_width
+        if cursor_x - self.scroll_x > width:
+            self.scroll_x = cursor_x - width
+        elif cursor_x < self.scroll_x:
+            self.scroll_x = cursor_x
+        self.scroll_x = max(0, min(self.scroll_x, max(self.buffer.width - width, 0)))
+
+        span_key = (self.buffer.version, self.cursor, self.scroll_x, width)
+        if span_key != self._span_key:
+            self._span_key = span_key
+            self._span = self.buffer.span_around_gap(self.scroll_x, self.scroll_x + width)
+        return self._span
+
+    def visible_text(self, start: int, end: int) -> str:
+        return self.mask * (end - start) if self.mask is not None else self.buffer.slice(start, end)
 
 
 @dataclass
 class InputField:
     active_input_fields: ClassVar[list['InputField', ...]] = []
     active_input: ClassVar[None or 'InputField'] = None
+    batched_render: ClassVar[bool] = True
+    spatial_index: ClassVar[SpatialGrid] = SpatialGrid()
+    event_types: ClassVar[tuple[int, ...]] = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.TEXTINPUT)
+    selection_color: ClassVar[T_COLOR] = (150, 190, 255)
+    cursor_width: ClassVar[int] = 2
     rect_not_active_color: T_COLOR = field(default=None, kw_only=True)
+    incremental: bool = field(default=False, kw_only=True)
+    editor: TextEditor | None = field(default=None, kw_only=True, repr=False, compare=False)
 
     input_rect: Sequence[int, int, int, int, T_COLOR] | Rect = (0, 0, 0, 0, (0, 0, 0))
     rect_active_color: T_COLOR | None = None
@@ -534,6 +2172,9 @@ class InputField:
             self._empty_text = Text(x=self.input_rect.x, y=self.input_rect.y, resize_max_width=self.input_rect.width,
                                     resize_max_height=self.input_rect.height, font='monospace')
 
+        self._text.x, self._text.y = self.input_rect.x, self.input_rect.y
+        self._empty_text.x, self._empty_text.y = self.input_rect.x, self.input_rect.y
+
         if self._empty_text.resize_max_width is None:
             self._empty_text.resize_max_width = self.input_rect.width
         if self._empty_text.resize_max_height is None:
@@ -542,15 +2183,43 @@ class InputField:
         self.text.auto_size_font()
         self.empty_text.auto_size_font()
 
+        if self.incremental:
+            self.editor = TextEditor(self.editor_font_key, self.text_hidden, self.replace_text_char or None)
+            self.editor.move(len(self.editor))
+            if InputField.active_input is self:
+                pygame.key.start_text_input()
+
         InputField.active_input_fields.append(self)
+        InputField.spatial_index.insert(self, self.input_rect.rect)
+
+    def __setattr__(self, key, value) -> None:
+        if key == 'input_rect':
+            old_rect = vars(self).get('input_rect')
+            if isinstance(old_rect, Rect | SlottedRect):
+                old_rect.remove_geometry_observer(self._input_rect_moved)
+            if isinstance(value, Rect | SlottedRect):
+                value.add_geometry_observer(self._input_rect_moved)
+                if self in InputField.spatial_index:
+                    InputField.spatial_index.update(self, value.rect)
+
+        super().__setattr__(key, value)
+
+    def _input_rect_moved(self, rect: Rect) -> None:
+        InputField.spatial_index.update(self, rect.rect)
 
     @property
     def text_str(self) -> str:
+        if self.editor is not None:
+            return self.editor.text if self.editor.mask is None else self.editor.mask * len(self.editor)
         return self._text.text
 
     @text_str.setter
     def text_str(self, value) -> None:
-        if isinstance(value, str):
+        if isinstance(value, str) and self.editor is not None:
+            self.editor.set_text(value)
+            self.editor.move(len(self.editor))
+            self.editor_changed()
+        elif isinstance(value, str):
             if self.replace_text_char:
                 self._text.text = len(value) * self.replace_text_char
                 self._hidden_text = value
@@ -572,6 +2241,8 @@ class InputField:
 
     @property
     def text_hidden(self) -> str:
+        if self.editor is not None:
+            return self.editor.text
         if self.replace_text_char:
             return self._hidden_text
         else:
@@ -603,6 +2274,28 @@ class InputField:
     def rect_color(self) -> T_COLOR:
         return self.input_rect.color
 
+    @property
+    def parts(self) -> tuple:
+        return self.input_rect, self.text, self.empty_text
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        text_objs = (self.empty_text,) if self.editor is not None else (self.text, self.empty_text)
+        return self.input_rect.bounds.unionall([text_obj.bounds for text_obj in text_objs
+                                                if text_obj is not None and text_obj.bounds is not None])
+
+    @property
+    def editor_font_key(self) -> tuple[str, int, bool, bool]:
+        return self.text.font, self.text.font_size, self.text.bold, self.text.italic
+
+    @property
+    def editor_area(self) -> pygame.Rect:
+        return self.input_rect.rect.inflate(-(self.text.margin // 2) * 2, 0)
+
+    def editor_changed(self) -> None:
+        if DirtyRects.tracking:
+            DirtyRects.changed(self)
+
     def is_allowed(self, char: str) -> bool:
         if char in self.restricted_characters:
             return False
@@ -625,34 +2318,154 @@ class InputField:
         self.input_rect.render(display)
 
         text_x, text_y = self.input_rect.x, self.input_rect.y
-        if self.text_str == '' and not self == InputField.active_input:
+        empty = len(self.editor) == 0 if self.editor is not None else self.text_str == ''
+        if empty and not self == InputField.active_input:
             self.empty_text.x, self.empty_text.y = text_x, text_y
             self.empty_text.render(display)
+        elif self.editor is not None:
+            self.render_editor(display)
         else:
             self.text.x, self.text.y = text_x, text_y
             self.text.render(display)
 
+    def render_editor(self, display: pygame.Surface) -> None:
+        editor, text = self.editor, self.text
+        editor.set_font(self.editor_font_key)
+        font = editor.font
+        area = self.editor_area
+        start, end, start_x = editor.visible_span(area.width)
+        origin_x = area.x - editor.scroll_x
+        text_y = self.input_rect.y + (self.input_rect.height - font.get_height()) // 2
+        active = self is InputField.active_input
+
+        selection = editor.selection
+        if active and selection is not None:
+            selection_x = origin_x + editor.buffer.x_of(selection[0])
+            selection_rect = pygame.Rect(selection_x, text_y, origin_x + editor.buffer.x_of(selection[1]) - selection_x,
+                                         font.get_height()).clip(area)
+            BlitBatch.barrier(display)
+            display.fill(InputField.selection_color, selection_rect)
+
+        if end > start:
+            text_render = TextSurfaceCache.get(font, editor.visible_text(start, end), text.font, text.font_size,
+                                               text.bold, text.italic, text.color, text.antialias)
+            span_x = origin_x + start_x
+            blit_x = max(span_x, area.x)
+            BlitBatch.blit(display, text_render, (blit_x, text_y),
+                           pygame.Rect(blit_x - span_x, 0, area.right - blit_x, text_render.get_height()))
+
+        cursor_x = origin_x + editor.buffer.before_width
+        if active and area.x <= cursor_x <= area.right:
+            BlitBatch.barrier(display)
+            display.fill(text.color, (min(cursor_x, area.right - InputField.cursor_width), text_y,
+                                      InputField.cursor_width, font.get_height()))
+
+    def insert_text(self, text: str) -> None:
+        text = ''.join(char for char in text if char.isprintable() and self.is_allowed(char))
+        if self.editor is None:
+            new_text = self.text_hidden + text
+            self.text_str = new_text[:self.character_max] if self.character_max is not None else new_text
+            return
+
+        selection = self.editor.selection
+        if self.character_max is not None:
+            selected = selection[1] - selection[0] if selection is not None else 0
+            text = text[:max(self.character_max - len(self.editor) + selected, 0)]
+        if text or selection is not None:
+            self.editor.insert(text)
+            self.editor_changed()
+
+    def process_editor_key(self, event) -> None:
+        editor = self.editor
+        mods = getattr(event, 'mod', 0)
+        select, command = bool(mods & pygame.KMOD_SHIFT), bool(mods & (pygame.KMOD_CTRL | pygame.KMOD_META))
+        selection = editor.selection
+
+        match event.key:
+            case pygame.K_LEFT:
+                editor.move(selection[0] if selection is not None and not select else editor.cursor - 1, select)
+            case pygame.K_RIGHT:
+                editor.move(selection[1] if selection is not None and not select else editor.cursor + 1, select)
+            case pygame.K_HOME:
+                editor.move(0, select)
+            case pygame.K_END:
+                editor.move(len(editor), select)
+            case pygame.K_DELETE if self.can_del:
+                editor.delete(backward=False)
+            case pygame.K_a if command:
+                editor.select_all()
+            case pygame.K_c if command and editor.mask is None:
+                InputField.put_clipboard(editor.selected_text)
+            case pygame.K_x if command and editor.mask is None and self.can_del:
+                InputField.put_clipboard(editor.delete_selection())
+            case pygame.K_v if command:
+                self.insert_text(InputField.get_clipboard())
+            case _:
+                return
+        self.editor_changed()
+
+    @staticmethod
+    def get_clipboard() -> str:
+        try:
+            if not pygame.scrap.get_init():
+                pygame.scrap.init()
+            content = pygame.scrap.get(pygame.SCRAP_TEXT)
+        except pygame.error:
+            return ''
+        return content.decode('utf-8', errors='ignore').rstrip('\x00') if content else ''
+
+    @staticmethod
+    def put_clipboard(text: str) -> None:
+        if not text:
+            return
+        try:
+            if not pygame.scrap.get_init():
+                pygame.scrap.init()
+            pygame.scrap.put(pygame.SCRAP_TEXT, text.encode('utf-8'))
+        except pygame.error:
+            pass
+
     @classmethod
     def activate(cls, input_field) -> None:
+        previous_input = cls.active_input
         if cls.active_input is not None:
             cls.active_input.input_rect.color = input_field.rect_not_active_color
 
         cls.active_input = input_field
         if input_field is not None and input_field.rect_active_color is not None:
             input_field.input_rect.color = input_field.rect_active_color
+        if input_field is not None and input_field.editor is not None:
+            pygame.key.start_text_input()
+        elif previous_input is not None and previous_input.editor is not None:
+            pygame.key.stop_text_input()
+
+        if DirtyRects.tracking:
+            for changed_input in (previous_input, input_field):
+                if changed_input is not None:
+                    DirtyRects.changed(changed_input)
 
     @classmethod
     def deactivate(cls) -> None:
         if cls.active_input is not None:
             cls.active_input.input_rect.color = cls.active_input.rect_not_active_color
+            if DirtyRects.tracking:
+                DirtyRects.changed(cls.active_input)
+            if cls.active_input.editor is not None:
+                pygame.key.stop_text_input()
             cls.active_input = None
 
     @classmethod
+    @RenderProfiler.section('InputField.process_input')
     def process_input(cls, event) -> None | str:
         if cls.active_input is None:
             return
         active_field = cls.active_input
 
+        if event.type == pygame.TEXTINPUT:
+            if active_field.editor is not None:
+                active_field.insert_text(event.text)
+            return
+
         if event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_BACKSPACE):
             if event.key == pygame.K_ESCAPE and active_field.exit_esc:
                 cls.deactivate()
@@ -670,46 +2483,220 @@ class InputField:
                 return return_text
 
             elif event.key == pygame.K_BACKSPACE and active_field.can_del:
-                if len(active_field.text_str) >= 1:
+                if active_field.editor is not None:
+                    active_field.editor.delete()
+                    active_field.editor_changed()
+                elif len(active_field.text_str) >= 1:
                     active_field.text_str = active_field.text_str[:-1]
                 return
 
-        elif active_field.is_allowed(event.unicode):
-            if active_field.character_max is not None and len(active_field.text_str) < active_field.character_max:
-                active_field.text_str += event.unicode
-            elif active_field.character_max is None:
-                active_field.text_str += event.unicode
-            return
+        elif active_field.editor is not None:
+            active_field.process_editor_key(event)
+            return
+
+        elif active_field.is_allowed(event.unicode):
+            if active_field.character_max is not None and len(active_field.text_str) < active_field.character_max:
+                active_field.text_str += event.unicode
+            elif active_field.character_max is None:
+                active_field.text_str += event.unicode
+            return
+
+        print(f'Input processing is not implemented for {event.unicode}')
+        return
+
+    def check_collision(self, event_pos: tuple[int, int] | None = None) -> bool:
+        event_pos = pygame.mouse.get_pos() if event_pos is None else event_pos
+
+        if self.input_rect.rect.collidepoint(event_pos):
+            InputField.activate(self)
+            if self.editor is not None:
+                self.editor.visible_span(self.editor_area.width)
+                self.editor.move(self.editor.position_at(event_pos[0] - self.editor_area.x + self.editor.scroll_x))
+                self.editor_changed()
+            return True
+        else:
+            if InputField.active_input == self:
+                InputField.deactivate()
+
+    @classmethod
+    @RenderProfiler.section('InputField.check_all_collisions')
+    def check_all_collisions(cls, event_pos: tuple[int, int] | None = None):
+        mouse_position = pygame.mouse.get_pos() if event_pos is None else event_pos
+
+        for input_field in cls.spatial_index.query_point(mouse_position, extra=(cls.active_input,)):
+            input_field.check_collision(mouse_position)
+
+    @classmethod
+    @RenderProfiler.section('InputField.handle_events')
+    def handle_events(cls, event: pygame.event.Event, members: Mapping[int, 'InputField']) -> None | str:
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for input_field in cls.spatial_index.query_point(event.pos, extra=(cls.active_input,)):
+                if id(input_field) in members or input_field is cls.active_input:
+                    input_field.check_collision(event.pos)
+
+        elif event.type in (pygame.KEYDOWN, pygame.TEXTINPUT) and cls.active_input is not None and \
+                id(cls.active_input) in members:
+            return cls.process_input(event)
+
+    def __repr__(self) -> str:
+        return f'pos: ({self.input_rect.x}, {self.input_rect.y}) - text: {self.text_str}'
+
+
+class AssetCache:
+    max_scaled: ClassVar[int] = 256
+    max_workers: ClassVar[int] = 4
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+    evictions: ClassVar[int] = 0
+    generation: ClassVar[int] = 0
+    _originals: ClassVar[dict[str, pygame.Surface]] = {}
+    _converted: ClassVar[set[str]] = set()
+    _scaled: ClassVar[OrderedDict] = OrderedDict()
+    _pending: ClassVar[dict[str, Future]] = {}
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+
+    @staticmethod
+    def display_format(surface: pygame.Surface) -> pygame.Surface:
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    @classmethod
+    def load(cls, path: str) -> pygame.Surface:
+        surface = cls._originals.get(path)
+        if surface is None:
+            cls.misses += 1
+            if path in cls._pending:
+                surface = cls._originals[path] = cls._pending.pop(path).result()
+            else:
+                surface = cls._originals[path] = pygame.image.load(path)
+        else:
+            cls.hits += 1
+
+        if path not in cls._converted and pygame.display.get_surface() is not None:
+            surface = cls._originals[path] = cls.display_format(surface)
+            cls._converted.add(path)
+        return surface
+
+    @classmethod
+    def request(cls, path: str) -> None:
+        if path in cls._originals or path in cls._pending:
+            return
+
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix='asset-loader')
+        cls._pending[path] = cls._executor.submit(pygame.image.load, path)
+
+    @classmethod
+    def ready(cls, path: str) -> bool:
+        if path in cls._originals:
+            return True
+        future = cls._pending.get(path)
+        return future is not None and future.done()
+
+    @classmethod
+    def wait(cls, paths: Iterable[str], timeout: float | None = None) -> bool:
+        futures = [cls._pending[path] for path in paths if path in cls._pending]
+        return not wait(futures, timeout).not_done
+
+    @classmethod
+    def scaled(cls, path: str, size: tuple[int, int]) -> pygame.Surface:
+        original = cls.load(path)
+        if original.get_size() == size:
+            return original
+
+        key = (path, size)
+        surface = cls._scaled.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls._scaled.move_to_end(key)
+            return surface
+
+        cls.misses += 1
+        surface = cls._scaled[key] = pygame.transform.scale(original, size)
+        while len(cls._scaled) > cls.max_scaled:
+            cls._scaled.popitem(last=False)
+            cls.evictions += 1
+        return surface
+
+    @classmethod
+    def convert_all(cls) -> None:
+        if pygame.display.get_surface() is None:
+            return
+
+        converted = [path for path in cls._originals if path not in cls._converted]
+        if not converted:
+            return
+
+        for path in converted:
+            cls._originals[path] = cls.display_format(cls._originals[path])
+            cls._converted.add(path)
+        for key in [key for key in cls._scaled if key[0] in cls._converted]:
+            del cls._scaled[key]
+        cls.generation += 1
+
+    @classmethod
+    def clear(cls, reset_stats: bool = False) -> None:
+        cls._originals.clear()
+        cls._converted.clear()
+        cls._scaled.clear()
+        cls._pending.clear()
+        cls.generation += 1
+        if reset_stats:
+            cls.hits = cls.misses = cls.evictions = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {'originals': len(cls._originals), 'converted': len(cls._converted), 'scaled': len(cls._scaled),
+                'pending': len(cls._pending), 'max_scaled': cls.max_scaled, 'hits': cls.hits, 'misses': cls.misses,
+                'evictions': cls.evictions}
+
+
+class AssetPreloader:
+    def __init__(self, paths: Iterable[str]) -> None:
+        self.paths = tuple(dict.fromkeys(paths))
+        for path in self.paths:
+            AssetCache.request(path)
+
+    @property
+    def total(self) -> int:
+        return len(self.paths)
 
-        print(f'Input processing is not implemented for {event.unicode}')
-        return
+    @property
+    def loaded(self) -> int:
+        return sum(1 for path in self.paths if AssetCache.ready(path))
 
-    def check_collision(self, event_pos: tuple[int, int] | None = None) -> bool:
-        event_pos = pygame.mouse.get_pos() if event_pos is None else event_pos
+    @property
+    def progress(self) -> float:
+        return self.loaded / self.total if self.total > 0 else 1.0
 
-        if self.input_rect.rect.collidepoint(event_pos):
-            InputField.activate(self)
-            return True
-        else:
-            if InputField.active_input == self:
-                InputField.deactivate()
+    @property
+    def done(self) -> bool:
+        return self.loaded == self.total
 
-    @classmethod
-    def check_all_collisions(cls):
-        mouse_position = pygame.mouse.get_pos()
+    def wait(self, timeout: float | None = None) -> bool:
+        return AssetCache.wait(self.paths, timeout)
 
-        for input_field in cls.active_input_fields:
-            input_field.check_collision(mouse_position)
+    def finish(self) -> None:
+        for path in self.paths:
+            AssetCache.load(path)
 
     def __repr__(self) -> str:
-        return f'pos: ({self.input_rect.x}, {self.input_rect.y}) - text: {self.text_str}'
+        return f'AssetPreloader: {self.loaded}/{self.total}'
 
 
 @dataclass
 class Image:
     assests_folder_path: ClassVar[str | None] = None
+    placeholder_color: ClassVar[T_COLOR] = (200, 200, 200)
+    batched_render: ClassVar[bool] = True
     image: pygame.Surface = field(default=None, kw_only=True)
+    lazy: bool = field(default=False, kw_only=True)
+    loading: bool = field(default=False, kw_only=True, compare=False, repr=False)
     border_rect: Rect = field(default=None, kw_only=True)
+    _asset: pygame.Surface | None = field(default=None, kw_only=True, compare=False, repr=False)
+    _asset_size: tuple[int, int] | None = field(default=None, kw_only=True, compare=False, repr=False)
+    _asset_generation: int = field(default=-1, kw_only=True, compare=False, repr=False)
 
     _path: str = ''
     x: int = 0
@@ -722,14 +2709,27 @@ class Image:
     border: int = 0
     border_color: T_COLOR = (0, 0, 0)
 
+    _dirty_attributes: ClassVar[frozenset[str]] = frozenset(('image', 'x', 'y', 'border', 'border_color'))
+
     def __post_init__(self) -> None:
-        self.image = pygame.image.load(self.path)
+        if self.lazy and not AssetCache.ready(self.path):
+            self.set_placeholder()
+        else:
+            self.load_asset()
 
-        if self.resize_to is not None:
-            self.resize(self.resize_to)
+            if self.resize_to is not None:
+                self.resize(self.resize_to)
 
         self.set_border()
 
+    def __setattr__(self, key, value) -> None:
+        old_bounds = DirtyRects.before_change(self, key, value) if DirtyRects.tracking else None
+        super().__setattr__(key, value)
+        if key in Image._dirty_attributes and 'border_color' in vars(self) and self.image is not None:
+            self.set_border()
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
     @property
     def width(self) -> int:
         if self.image is not None:
@@ -760,32 +2760,105 @@ class Image:
         else:
             return self._path
 
-    def set_border(self) -> None:
+    @property
+    def parts(self) -> tuple:
+        return (self.border_rect,) if self.border_rect is not None else ()
+
+    @property
+    def bounds(self) -> pygame.Rect | None:
+        if self.image is None or self.loading:
+            return None
         if self.border > 0:
-            self.border_rect = Rect(self.x - self.border, self.y - self.border, self.width + 2 * self.border,
-                                    self.height + 2 * self.border, color=self.border_color, border=self.border)
+            return self.border_rect.bounds
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def set_border(self) -> None:
+        if self.border <= 0:
+            return
+        geometry = (self.x - self.border, self.y - self.border, self.width + 2 * self.border,
+                    self.height + 2 * self.border)
+        if self.border_rect is None:
+            self.border_rect = Rect(*geometry, color=self.border_color, border=self.border)
+        else:
+            self.border_rect.set_attributes(x=geometry[0], y=geometry[1], width=geometry[2], height=geometry[3],
+                                            color=self.border_color, border=self.border)
+
+    def set_placeholder(self) -> None:
+        size = tuple(self.resize_to) if self.resize_to is not None and None not in self.resize_to else (0, 0)
+        self.image = pygame.Surface(size, pygame.SRCALPHA, 32)
+        self.image.fill(Image.placeholder_color)
+        self._asset = None
+        self.loading = True
+
+    def poll_asset(self) -> bool:
+        if not self.loading:
+            return False
+        if not AssetCache.ready(self.path):
+            AssetCache.request(self.path)
+            return False
+
+        old_bounds = pygame.Rect(self.x, self.y, self.width, self.height).inflate(2 * self.border, 2 * self.border)
+        self.loading = False
+        self.load_asset()
+        if self.resize_to is not None:
+            self.resize(self.resize_to)
+        else:
+            self.set_border()
+
+        if DirtyRects.enabled:
+            DirtyRects.mark(old_bounds, self.bounds)
+        return True
+
+    def load_asset(self) -> None:
+        if self._asset_size is None:
+            self.image = AssetCache.load(self.path)
+        else:
+            self.image = AssetCache.scaled(self.path, self._asset_size)
+        self._asset = self.image
+        self._asset_generation = AssetCache.generation
 
     def resize(self, size: Sequence[int | None, int | None] | None = None) -> None:
-        size = size if size is not None else self.resize
+        size = size if size is not None else self.resize_to
+        if self.loading:
+            self.resize_to = size
+            if None not in size:
+                self.set_placeholder()
+            return
+
+        old_bounds = self.bounds if DirtyRects.tracking else None
+        from_asset = self.image is self._asset
+        source = AssetCache.load(self.path) if from_asset else self.image
 
         if None not in size:
             size = (max(0, size[0]), max(0, size[1]))
-            self.image = pygame.transform.scale(self.image, size)
         elif size[1] is None:
-            factor = size[0] / self.width
-            self.image = pygame.transform.scale_by(self.image, factor)
+            factor = size[0] / source.get_width()
+            size = (int(source.get_width() * factor), int(source.get_height() * factor))
         elif size[0] is None:
-            factor = size[1] / self.height
-            self.image = pygame.transform.scale_by(self.image, factor)
+            factor = size[1] / source.get_height()
+            size = (int(source.get_width() * factor), int(source.get_height() * factor))
+
+        if from_asset:
+            self._asset_size = size
+            self.load_asset()
+        else:
+            self.image = pygame.transform.scale(source, size)
 
         self.set_border()
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
 
     def render(self, display: pygame.Surface | None = None) -> None:
         display = display if display is not None else Display.window()
         if display is None:
             raise ValueError('Display argument missing')
 
-        display.blit(self.image, (self.x, self.y))
+        if self.loading:
+            self.poll_asset()
+        elif self._asset_generation != AssetCache.generation and self.image is self._asset:
+            self.load_asset()
+
+        BlitBatch.blit(display, self.image, (self.x, self.y))
         if self.border > 0:
             self.border_rect.render(display)
 
@@ -794,9 +2867,16 @@ class Image:
 
 
 class ObjectAnimation:
+    @dataclass(frozen=True)
+    class CompiledAction:
+        step: Callable[[object, int], int]
+        attributes: tuple[str, ...] = ()
+        idle: bool = False
+
     @dataclass
     class Action:
         display_fps: ClassVar[int] = Display.fps if Display.fps is not None else 60
+        timing_keys: ClassVar[tuple[str, ...]] = ('time', 'duration', 'easing')
 
         SCALE: int = 0
         SCALE_TO: int = 1
@@ -807,115 +2887,136 @@ class ObjectAnimation:
         SET_COLOR_TO: int = 6
         CHANGE_BORDER_WIDTH_TO: int = 7
 
+        @classmethod
+        def action_name(cls, action: int) -> str:
+            for name, value in vars(cls).items():
+                if name.isupper() and value == action:
+                    return name
+            return str(action)
+
         @classmethod
         def execute(cls, objects, cur_object_index, start_action_time, action: int = None, **kwargs):
-            wait_time = 0
-            object_index = None
-            cur_object = objects[cur_object_index]
+            compiled_action = cls.compile(action, **kwargs)
+            try:
+                return compiled_action.step(objects[cur_object_index], start_action_time), None
+            except AttributeError:
+                raise AttributeError('The animation object misses attributes to be compatible with this Action')
 
+        @classmethod
+        def compile(cls, action: int = None, **kwargs) -> 'ObjectAnimation.CompiledAction':
+            """Resolves an action into a step function that applies one frame to an object and returns the wait time."""
             if action is None:
-                return wait_time, object_index
-
-            if 'time' in kwargs.keys():
-                if action in (cls.SCALE_TO, cls.MOVE_TO, cls.CHANGE_CORNER_RADIUS_TO, cls.CHANGE_BORDER_WIDTH_TO):
-                    wait_time = start_action_time - Frame.get() + kwargs['time']
+                return ObjectAnimation.CompiledAction(lambda cur_object, start_action_frame: 0, idle=True)
+
+            if action == cls.SET_COLOR_TO:
+                if 'color' not in kwargs.keys():
+                    raise KeyError('color key should be given to use SET_COLOR_TO action')
+                cls.check_keys(action, kwargs, ('color',))
+                color = kwargs['color']
+                wait_time = kwargs.get('time', 0)
+
+                def set_color(cur_object, start_action_frame):
+                    cur_object.color = color
+                    return wait_time
+
+                return ObjectAnimation.CompiledAction(set_color, ('color',), idle=True)
+
+            if action not in ObjectAnimation.timed_attributes:
+                raise ValueError('Invalid Action value')
+
+            keys = tuple(key for key, _ in ObjectAnimation.timed_attributes[action])
+            tracks = tuple((key, attribute) for key, attribute in ObjectAnimation.timed_attributes[action]
+                           if key in kwargs.keys())
+            if not tracks:
+                raise KeyError(f'{" and/or ".join(keys)} key should be given to use {cls.action_name(action)} action')
+            cls.check_keys(action, kwargs, keys)
+            attributes = tuple(attribute for _, attribute in tracks)
+
+            if action in ObjectAnimation.relative_actions:
+                wait_time = kwargs.get('time', 0)
+                transform_factor = 1 / max(wait_time, 1) if 'time' in kwargs.keys() else 1
+                steps = tuple((attribute, int(kwargs[key] * transform_factor)) for key, attribute in tracks)
+                steps = tuple((attribute, step_size) for attribute, step_size in steps if step_size != 0)
+
+                def change(cur_object, start_action_frame):
+                    for attribute, step_size in steps:
+                        setattr(cur_object, attribute, getattr(cur_object, attribute) + step_size)
+                    return wait_time
+
+                return ObjectAnimation.CompiledAction(change, attributes, idle=not steps)
+
+            targets = tuple((attribute, kwargs[key]) for key, attribute in tracks)
+            action_time = kwargs.get('time')
+
+            def change_to(cur_object, start_action_frame):
+                if action_time is not None:
+                    wait_time = start_action_frame - Frame.get() + action_time
+                    transform_factor = 1 / max(wait_time, 1)
                 else:
-                    wait_time = kwargs['time']
-                transform_factor = 1 / max(wait_time, 1)
-            else:
-                transform_factor = 1
-
-            try:
-                match action:
-                    case cls.SCALE:
-                        if 'width' in kwargs.keys():
-                            step_size = int(kwargs['width'] * transform_factor)
-                            cur_object.width += step_size
-                        if 'height' in kwargs.keys():
-                            step_size = int(kwargs['height'] * transform_factor)
-                            cur_object.height += step_size
-
-                        if 'width' not in kwargs.keys() and 'height' not in kwargs.keys():
-                            raise KeyError('width and/or height key should be given to use SCALE action')
-
-                    case cls.SCALE_TO:
-                        if 'width' in kwargs.keys():
-                            delta_w = kwargs['width'] - cur_object.width
-                            step_size = int(delta_w * transform_factor)
-                            cur_object.width += step_size
-                        if 'height' in kwargs.keys():
-                            delta_h = kwargs['height'] - cur_object.height
-                            step_size = int(delta_h * transform_factor)
-                            cur_object.height += step_size
-
-                        if 'width' not in kwargs.keys() and 'height' not in kwargs.keys():
-                            raise KeyError('width and/or height key should be given to use SCALE_TO action')
-
-                    case cls.MOVE:
-                        if 'x' in kwargs.keys():
-                            step_size = int(kwargs['x'] * transform_factor)
-                            cur_object.x += step_size
-                        if 'y' in kwargs.keys():
-                            step_size = int(kwargs['y'] * transform_factor)
-                            cur_object.y += step_size
-
-                        if 'x' not in kwargs.keys() and 'y' not in kwargs.keys():
-                            raise KeyError('x and/or y key should be given to use MOVE action')
-
-                    case cls.MOVE_TO:
-                        if 'x' in kwargs.keys():
-                            delta_x = kwargs['x'] - cur_object.x
-                            step_size = int(delta_x * transform_factor)
-                            cur_object.x += step_size
-                        if 'y' in kwargs.keys():
-                            delta_y = kwargs['y'] - cur_object.y
-                            step_size = int(delta_y * transform_factor)
-                            cur_object.y += step_size
-
-                        if 'x' not in kwargs.keys() and 'y' not in kwargs.keys():
-                            raise KeyError('x and/or y key should be given to use MOVE_TO action')
-
-                    case cls.CHANGE_CORNER_RADIUS:
-                        if 'radius' in kwargs.keys():
-                            step_size = int(kwargs['radius'] * transform_factor)
-                            cur_object.corner_radius_all += step_size
-                        else:
-                            raise KeyError('radius key should be given to use CHANGE_CORNER_RADIUS action')
+                    wait_time = 0
+                    transform_factor = 1
 
-                    case cls.CHANGE_CORNER_RADIUS_TO:
-                        if 'radius' in kwargs.keys():
-                            delta_r = kwargs['radius'] - cur_object.corner_radius_all
-                            step_size = int(delta_r * transform_factor)
-                            cur_object.corner_radius_all += step_size
-                        else:
-                            raise KeyError('radius key should be given to use CHANGE_CORNER_RADIUS_TO action')
-
-                    case cls.SET_COLOR_TO:
-                        if 'color' in kwargs.keys():
-                            cur_object.color = kwargs['color']
-                        else:
-                            raise KeyError('color key should be given to use SET_COLOR_TO action')
-
-                    case cls.CHANGE_BORDER_WIDTH_TO:
-                        if 'border' in kwargs.keys():
-                            delta_b = kwargs['border'] - cur_object.border
-                            step_size = int(delta_b * transform_factor)
-                            cur_object.border += step_size
-                        else:
-                            raise KeyError('border key should be given to use CHANGE_BORDER_WIDTH_TO action')
-
-                    case _:
-                        raise ValueError('Invalid Action value')
+                for attribute, target in targets:
+                    value = getattr(cur_object, attribute)
+                    setattr(cur_object, attribute, value + int((target - value) * transform_factor))
+                return wait_time
 
-            except AttributeError:
-                raise AttributeError('The animation object misses attributes to be compatible with this Action')
+            return ObjectAnimation.CompiledAction(change_to, attributes)
 
-            return wait_time, object_index
+        @classmethod
+        def check_keys(cls, action: int, kwargs: Mapping, keys: Sequence[str]) -> None:
+            unknown_keys = [key for key in kwargs.keys() if key not in keys and key not in cls.timing_keys]
+            if unknown_keys:
+                raise KeyError(f'{", ".join(unknown_keys)} cannot be used with {cls.action_name(action)} action')
+
+    class Easing:
+        @staticmethod
+        def linear(progress):
+            return progress
+
+        @staticmethod
+        def ease_in(progress):
+            return progress * progress
+
+        @staticmethod
+        def ease_out(progress):
+            return progress * (2 - progress)
+
+        @staticmethod
+        def ease_in_out(progress):
+            return 2 * progress * progress * (progress < 0.5) + (1 - 2 * (1 - progress) * (1 - progress)) * \
+                (progress >= 0.5)
+
+        @staticmethod
+        def ease_in_cubic(progress):
+            return progress * progress * progress
+
+        @staticmethod
+        def ease_out_cubic(progress):
+            return 1 - (1 - progress) * (1 - progress) * (1 - progress)
+
+    timed_attributes: dict[int, tuple[tuple[str, str], ...]] = {
+        Action.SCALE: (('width', 'width'), ('height', 'height')),
+        Action.SCALE_TO: (('width', 'width'), ('height', 'height')),
+        Action.MOVE: (('x', 'x'), ('y', 'y')),
+        Action.MOVE_TO: (('x', 'x'), ('y', 'y')),
+        Action.CHANGE_CORNER_RADIUS: (('radius', 'corner_radius_all'),),
+        Action.CHANGE_CORNER_RADIUS_TO: (('radius', 'corner_radius_all'),),
+        Action.CHANGE_BORDER_WIDTH_TO: (('border', 'border'),)
+    }
+    relative_actions: tuple[int, ...] = (Action.SCALE, Action.MOVE, Action.CHANGE_CORNER_RADIUS)
 
-    running_animations: MutableSequence = []
+    clock: Callable[[], float] = time.monotonic
+    running_animations: MutableMapping = {}
+    stepping_animations: MutableMapping = {}
+    running_batches: MutableSequence = []
+    _frame_wakeups: list = []
+    _time_wakeups: list = []
+    _wakeup_count: int = 0
 
     def __init__(self, action_sequence: MutableSequence[Sequence[int, dict[str, int]]],
-                 animation_objects: Sequence, stop_reset: bool = True):
+                 animation_objects: Sequence, stop_reset: bool = True, time_based: bool = False,
+                 easing: Callable[[float], float] | None = None):
         self.action_sequence = action_sequence
         self.animation_objects = animation_objects
         self._start_object_setting = animation_objects[:]
@@ -926,16 +3027,49 @@ class ObjectAnimation:
         self.next_frame = 0
         self.stop_reset = stop_reset
 
-    def start(self):
-        if self not in ObjectAnimation.running_animations:
-            self.start_action_frame = Frame.get()
-            ObjectAnimation.running_animations.append(self)
-        else:
+        self.time_based = time_based
+        self.easing = easing if easing is not None else ObjectAnimation.Easing.linear
+        self.start_action_time = 0.0
+        self._action_duration = 0.0
+        self._action_easing = self.easing
+        self._timed_tracks: list[list] = []
+        self._wakeup: int | None = None
+        self._compiled_actions: list[ObjectAnimation.CompiledAction] = self.compile()
+
+    def compile(self) -> list['ObjectAnimation.CompiledAction']:
+        return [ObjectAnimation.Action.compile(action[0], **action[1]) for action in self.action_sequence]
+
+    def check_objects(self) -> None:
+        cur_object = self.animation_objects[self.object_index]
+        for compiled_action in self._compiled_actions:
+            if not all(hasattr(cur_object, attribute) for attribute in compiled_action.attributes):
+                raise AttributeError('The animation object misses attributes to be compatible with this Action')
+
+    def start(self, delay: int | float = 0):
+        """Starts the animation, after delay frames or seconds when a delay is given."""
+        if self in ObjectAnimation.running_animations:
             print('Animation already running')
+            return
+
+        self._compiled_actions = self.compile()
+        self.check_objects()
+
+        self.start_action_frame = Frame.get()
+        self.start_action_time = ObjectAnimation.clock()
+        ObjectAnimation.running_animations[self] = None
+
+        if delay > 0:
+            if self.time_based:
+                self.start_action_time += delay
+                ObjectAnimation.sleep(self, wake_time=self.start_action_time)
+            else:
+                self.start_action_frame += int(delay)
+                ObjectAnimation.sleep(self, wake_frame=self.start_action_frame)
+        else:
+            ObjectAnimation.stepping_animations[self] = None
 
     def stop(self):
-        if self in ObjectAnimation.running_animations:
-            ObjectAnimation.running_animations[ObjectAnimation.running_animations.index(self)] = None
+        ObjectAnimation.unschedule(self)
 
         if self.stop_reset:
             self.reset()
@@ -944,27 +3078,22 @@ class ObjectAnimation:
         if not self.stop_reset:
             self.stop()
         else:
-            if self in ObjectAnimation.running_animations:
-                ObjectAnimation.running_animations.remove(self)
+            ObjectAnimation.unschedule(self)
         self.action_index = 0
         self.object_index = 0
         self.start_action_frame = 0
         self.next_frame = 0
         self.started_move = False
+        self.start_action_time = 0.0
+        self._timed_tracks = []
         self.animation_objects = self._start_object_setting.copy()
 
     def render(self):
         self.animation_objects[self.object_index].render()
 
     def process_animation(self):
-        current_action = self.action_sequence[self.action_index]
-
-        wait_time, object_index = ObjectAnimation.Action.execute(self.animation_objects, self.object_index,
-                                                                 self.start_action_frame, current_action[0],
-                                                                 **current_action[1])
-
-        if object_index is not None:
-            self.object_index = object_index
+        wait_time = self._compiled_actions[self.action_index].step(self.animation_objects[self.object_index],
+                                                                   self.start_action_frame)
 
         if Frame.get() >= self.next_frame:
             self.start_action_frame = Frame.get()
@@ -982,13 +3111,301 @@ class ObjectAnimation:
             if wait_time <= 0:
                 self.process_animation()
 
+    def begin_timed_action(self, action: int | None, **kwargs) -> None:
+        cur_object = self.animation_objects[self.object_index]
+
+        if 'duration' in kwargs.keys():
+            self._action_duration = max(kwargs['duration'], 0)
+        elif 'time' in kwargs.keys():
+            self._action_duration = max(kwargs['time'], 0) / ObjectAnimation.Action.display_fps
+        else:
+            self._action_duration = 0.0
+        self._action_easing = kwargs.get('easing', self.easing)
+        self._timed_tracks = []
+
+        if action is None:
+            return
+
+        try:
+            if action == ObjectAnimation.Action.SET_COLOR_TO:
+                if 'color' not in kwargs.keys():
+                    raise KeyError('color key should be given to use SET_COLOR_TO action')
+                cur_object.color = kwargs['color']
+                return
+
+            if action not in ObjectAnimation.timed_attributes:
+                raise ValueError('Invalid Action value')
+
+            for key, attribute in ObjectAnimation.timed_attributes[action]:
+                if key in kwargs.keys():
+                    if action in ObjectAnimation.relative_actions:
+                        delta = kwargs[key]
+                    else:
+                        delta = kwargs[key] - getattr(cur_object, attribute)
+                    self._timed_tracks.append([attribute, delta, 0])
+
+        except AttributeError:
+            raise AttributeError('The animation object misses attributes to be compatible with this Action')
+
+        if not self._timed_tracks:
+            keys = ' and/or '.join(key for key, _ in ObjectAnimation.timed_attributes[action])
+            raise KeyError(f'{keys} key should be given to use {ObjectAnimation.Action.action_name(action)} action')
+
+    def process_timed_animation(self, now: float) -> None:
+        cur_object = self.animation_objects[self.object_index]
+
+        while self.action_index < len(self.action_sequence):
+            if not self.started_move:
+                current_action = self.action_sequence[self.action_index]
+                self.begin_timed_action(current_action[0], **current_action[1])
+                self.started_move = True
+
+            if self._action_duration > 0:
+                progress = min((now - self.start_action_time) / self._action_duration, 1)
+            else:
+                progress = 1
+            eased_progress = self._action_easing(progress)
+
+            for track in self._timed_tracks:
+                offset = round(track[1] * eased_progress)
+                if offset != track[2]:
+                    setattr(cur_object, track[0], getattr(cur_object, track[0]) + offset - track[2])
+                    track[2] = offset
+
+            if progress < 1:
+                return
+
+            self.start_action_time += self._action_duration
+            self.action_index += 1
+            self.started_move = False
+
+        self.stop()
+
+    def waiting(self) -> bool:
+        if not self.started_move:
+            return False
+
+        if self.time_based:
+            return all(track[1] == 0 for track in self._timed_tracks)
+
+        return self._compiled_actions[self.action_index].idle
+
+    @classmethod
+    def sleep(cls, animation: 'ObjectAnimation', wake_frame: int | None = None,
+              wake_time: float | None = None) -> None:
+        cls._wakeup_count += 1
+        animation._wakeup = cls._wakeup_count
+        cls.stepping_animations.pop(animation, None)
+
+        if wake_time is not None:
+            heapq.heappush(cls._time_wakeups, (wake_time, cls._wakeup_count, animation))
+        else:
+            heapq.heappush(cls._frame_wakeups, (wake_frame, cls._wakeup_count, animation))
+
+    @classmethod
+    def unschedule(cls, animation: 'ObjectAnimation') -> None:
+        cls.running_animations.pop(animation, None)
+        cls.stepping_animations.pop(animation, None)
+        animation._wakeup = None
+
+    @classmethod
+    def reset_scheduler(cls) -> None:
+        for animation in list(cls.running_animations):
+            animation.stop()
+        for batch in cls.running_batches[:]:
+            batch.stop()
+        cls.running_animations.clear()
+        cls.stepping_animations.clear()
+        cls._frame_wakeups.clear()
+        cls._time_wakeups.clear()
+
     @classmethod
+    def wake_animations(cls, frame: int, now: float) -> None:
+        for wakeups, current in ((cls._frame_wakeups, frame), (cls._time_wakeups, now)):
+            while wakeups and wakeups[0][0] <= current:
+                _, wakeup, animation = heapq.heappop(wakeups)
+                if animation._wakeup == wakeup:
+                    animation._wakeup = None
+                    cls.stepping_animations[animation] = None
+
+    @classmethod
+    @RenderProfiler.section('ObjectAnimation.update_animations')
     def update_animations(cls):
-        for animation in cls.running_animations:
-            if animation is not None:
+        now = cls.clock()
+        frame = Frame.get()
+        cls.wake_animations(frame, now)
+
+        for animation in list(cls.stepping_animations):
+            if animation not in cls.stepping_animations:
+                continue
+
+            if animation.time_based:
+                animation.process_timed_animation(now)
+                if animation in cls.stepping_animations and animation.waiting():
+                    cls.sleep(animation, wake_time=animation.start_action_time + animation._action_duration)
+            else:
                 animation.process_animation()
-
-        cls.running_animations = [a for a in cls.running_animations if a is not None]
+                if animation in cls.stepping_animations and animation.next_frame > frame + 1 and \
+                        animation.waiting():
+                    cls.sleep(animation, wake_frame=animation.next_frame)
+
+        for batch in cls.running_batches[:]:
+            batch.step(now)
+
+
+class AnimationBatch:
+    properties: tuple[str, ...] = ('x', 'y', 'width', 'height', 'border', 'corner_radius_all')
+    position_columns: frozenset[int] = frozenset((0, 1))
+
+    def __init__(self, easing: Callable | None = None, capacity: int = 1024) -> None:
+        if np is None:
+            raise ImportError('AnimationBatch requires numpy')
+
+        self.easing = easing if easing is not None else ObjectAnimation.Easing.linear
+        self._objects: list = []
+        self._rows: dict[int, int] = {}
+        self._columns: list[tuple[int, ...]] = []
+        self._direct: list[bool] = []
+        shape = (capacity, len(AnimationBatch.properties))
+        self._base = np.zeros(shape, dtype=np.float64)
+        self._delta = np.zeros(shape, dtype=np.float64)
+        self._start = np.zeros(shape, dtype=np.float64)
+        self._duration = np.zeros(shape, dtype=np.float64)
+        self._written = np.zeros(shape, dtype=np.int64)
+        self._active = np.zeros(shape, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._base):
+            return
+        capacity = max(size, 2 * len(self._base))
+        for name in ('_base', '_delta', '_start', '_duration', '_written', '_active'):
+            array = getattr(self, name)
+            grown = np.zeros((capacity, array.shape[1]), dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add(self, obj: object, action: int, start_time: float | None = None, **kwargs) -> None:
+        if action not in ObjectAnimation.timed_attributes:
+            raise ValueError('Invalid Action value for AnimationBatch')
+
+        if 'duration' in kwargs.keys():
+            duration = max(kwargs['duration'], 0)
+        elif 'time' in kwargs.keys():
+            duration = max(kwargs['time'], 0) / ObjectAnimation.Action.display_fps
+        else:
+            duration = 0.0
+        start_time = ObjectAnimation.clock() if start_time is None else start_time
+
+        tracks = []
+        try:
+            for key, attribute in ObjectAnimation.timed_attributes[action]:
+                if key in kwargs.keys():
+                    current = getattr(obj, attribute)
+                    delta = kwargs[key] if action in ObjectAnimation.relative_actions else kwargs[key] - current
+                    tracks.append((AnimationBatch.properties.index(attribute), current, delta))
+        except AttributeError:
+            raise AttributeError('The animation object misses attributes to be compatible with this Action')
+
+        if not tracks:
+            keys = ' and/or '.join(key for key, _ in ObjectAnimation.timed_attributes[action])
+            raise KeyError(f'{keys} key should be given to use {ObjectAnimation.Action.action_name(action)} action')
+
+        row = self._rows.get(id(obj))
+        if row is None:
+            row = len(self._objects)
+            self._reserve(row + 1)
+            self._rows[id(obj)] = row
+            self._objects.append(obj)
+            self._columns.append(())
+            self._direct.append(isinstance(obj, Shape))
+            self._active[row] = False
+
+        for column, current, delta in tracks:
+            self._base[row, column] = current
+            self._delta[row, column] = delta
+            self._start[row, column] = start_time
+            self._duration[row, column] = duration
+            self._written[row, column] = current
+            self._active[row, column] = True
+        self._columns[row] = tuple(np.flatnonzero(self._active[row]).tolist())
+        self._direct[row] = self._direct[row] and all(obj.direct_attribute(AnimationBatch.properties[column])
+                                                      for column, _, _ in tracks)
+
+    def start(self) -> None:
+        if self not in ObjectAnimation.running_batches:
+            ObjectAnimation.running_batches.append(self)
+
+    def stop(self) -> None:
+        if self in ObjectAnimation.running_batches:
+            ObjectAnimation.running_batches.remove(self)
+
+    def _write_back(self, rows: list[int], values: list[list[int]]) -> None:
+        properties = AnimationBatch.properties
+        objects, columns, direct = self._objects, self._columns, self._direct
+
+        for row, row_values in zip(rows, values):
+            obj = objects[row]
+            if not isinstance(obj, Shape | SlottedShape):
+                for column in columns[row]:
+                    setattr(obj, properties[column], row_values[column])
+            elif DirtyRects.tracking or not direct[row]:
+                obj.set_attributes(**{properties[column]: row_values[column] for column in columns[row]})
+            else:
+                obj_vars = vars(obj)
+                for column in columns[row]:
+                    obj_vars[properties[column]] = row_values[column]
+                if not AnimationBatch.position_columns.issuperset(columns[row]):
+                    obj.invalidate_surface()
+                obj._sync_geometry()
+
+    def step(self, now: float | None = None) -> None:
+        count = len(self._objects)
+        if count == 0:
+            self.stop()
+            return
+        now = ObjectAnimation.clock() if now is None else now
+
+        duration = self._duration[:count]
+        active = self._active[:count]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            progress = np.where(duration > 0, (now - self._start[:count]) / duration, 1.0)
+        progress = np.clip(progress, 0.0, 1.0)
+
+        values = np.rint(self._base[:count] + self._delta[:count] * self.easing(progress)).astype(np.int64)
+        values = np.where(active, values, self._written[:count])
+        changed_rows = np.flatnonzero((values != self._written[:count]).any(axis=1))
+        self._written[:count] = values
+
+        if len(changed_rows):
+            self._write_back(changed_rows.tolist(), values[changed_rows].tolist())
+
+        finished = active & (progress >= 1.0)
+        if finished.any():
+            active &= ~finished
+            finished_rows = np.flatnonzero(finished.any(axis=1))
+            for row in finished_rows.tolist():
+                self._columns[row] = tuple(np.flatnonzero(active[row]).tolist())
+
+            if not active.any():
+                self._objects.clear()
+                self._rows.clear()
+                self._columns.clear()
+                self._direct.clear()
+            elif not active.any(axis=1).all():
+                keep = np.flatnonzero(active.any(axis=1))
+                self._objects = [self._objects[row] for row in keep.tolist()]
+                self._columns = [self._columns[row] for row in keep.tolist()]
+                self._direct = [self._direct[row] for row in keep.tolist()]
+                self._rows = {id(obj): row for row, obj in enumerate(self._objects)}
+                for name in ('_base', '_delta', '_start', '_duration', '_written', '_active'):
+                    array = getattr(self, name)
+                    array[:len(keep)] = array[keep]
+
+        if not self._objects:
+            self.stop()
 
 
 @dataclass
@@ -996,6 +3413,9 @@ class Button:
     BUTTON_TYPES: ClassVar[tuple[str, ...]] = ('switch', 'push')
 
     active_buttons: ClassVar[list] = []
+    batched_render: ClassVar[bool] = True
+    spatial_index: ClassVar[SpatialGrid] = SpatialGrid()
+    event_types: ClassVar[tuple[int, ...]] = (pygame.MOUSEBUTTONDOWN,)
 
     _text: Text = field(default=None, kw_only=True)
 
@@ -1052,6 +3472,22 @@ class Button:
                     self.img.y = self.rect.y + (self.rect.height - self.img.height) // 2
 
         Button.active_buttons.append(self)
+        Button.spatial_index.insert(self, self.rect.rect)
+
+    def __setattr__(self, key, value) -> None:
+        if key == 'rect':
+            old_rect = vars(self).get('rect')
+            if isinstance(old_rect, Rect | SlottedRect):
+                old_rect.remove_geometry_observer(self._rect_moved)
+            if isinstance(value, Rect | SlottedRect):
+                value.add_geometry_observer(self._rect_moved)
+                if self in Button.spatial_index:
+                    Button.spatial_index.update(self, value.rect)
+
+        super().__setattr__(key, value)
+
+    def _rect_moved(self, rect: Rect) -> None:
+        Button.spatial_index.update(self, rect.rect)
 
     @property
     def text_str(self) -> str:
@@ -1075,6 +3511,15 @@ class Button:
         else:
             raise NotImplemented
 
+    @property
+    def parts(self) -> tuple:
+        return self.rect, self.text, self.img
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        return self.rect.bounds.unionall([part.bounds for part in (self.img, self.text)
+                                          if part is not None and part.bounds is not None])
+
     def call_func(self, kwargs_list: list[dict] = None, **kwargs) -> None:
         if self.call_on_press is not None:
             if isinstance(self.call_on_press, Callable):
@@ -1124,12 +3569,20 @@ class Button:
         return False
 
     @classmethod
-    def check_all_collisions(cls):
-        mouse_position = pygame.mouse.get_pos()
+    @RenderProfiler.section('Button.check_all_collisions')
+    def check_all_collisions(cls, event_pos: tuple[int, int] | None = None):
+        mouse_position = pygame.mouse.get_pos() if event_pos is None else event_pos
 
-        for button in cls.active_buttons:
+        for button in cls.spatial_index.query_point(mouse_position):
             button.check_collision(mouse_position)
 
+    @classmethod
+    @RenderProfiler.section('Button.handle_events')
+    def handle_events(cls, event: pygame.event.Event, members: Mapping[int, 'Button']) -> None:
+        for button in cls.spatial_index.query_point(event.pos):
+            if id(button) in members:
+                button.check_collision(event.pos)
+
     @classmethod
     def release_push_buttons(cls) -> None:
         for button in cls.active_buttons:
@@ -1143,8 +3596,22 @@ class Button:
 @dataclass
 class Bar:
     display_fps: ClassVar[int] = Display.fps if Display.fps is not None else 60
-    moving_bars: ClassVar[list] = []
+    moving_bars: ClassVar[dict[int, 'Bar']] = {}
+    movement: ClassVar['BarMovement | None'] = None
     active_bars: ClassVar[list] = []
+    batched_render: ClassVar[bool] = True
+    _geometry_attributes: ClassVar[frozenset[str]] = frozenset(('rect', 'max_value_range', 'display_range',
+                                                                'bar_border_width', 'bar_closed', 'start_fill_side'))
+    _dirty_attributes: ClassVar[frozenset[str]] = _geometry_attributes - {'rect'} | {
+        'bar_color', 'bar_inverse_color', 'allow_inverse', '_text', 'bar_bg_img'}
+    _fill_rect: pygame.Rect = field(default_factory=lambda: pygame.Rect(0, 0, 0, 0), kw_only=True, repr=False,
+                                    compare=False)
+    _max_stop_rect: pygame.Rect = field(default_factory=lambda: pygame.Rect(0, 0, 0, 0), kw_only=True, repr=False,
+                                        compare=False)
+    _min_stop_rect: pygame.Rect = field(default_factory=lambda: pygame.Rect(0, 0, 0, 0), kw_only=True, repr=False,
+                                        compare=False)
+    _stop_rects: tuple[pygame.Rect, ...] = field(default=(), kw_only=True, repr=False, compare=False)
+    _geometry_valid: bool = field(default=False, kw_only=True, repr=False, compare=False)
 
     rect: Sequence[int, int, int, int, T_COLOR] | Rect = (0, 0, 0, 0, (0, 0, 0))
     max_value_range: list[float] | None = None
@@ -1172,7 +3639,7 @@ class Bar:
 
         if isinstance(self.rect, Sequence):
             self.rect = Rect(*self.rect[:4], color=self.rect[4], border=self.bar_border_width)
-        elif isinstance(self.rect, Rect):
+        elif isinstance(self.rect, Rect | SlottedRect):
             if self.rect.border == 0:
                 self.rect.border = self.bar_border_width
             else:
@@ -1201,6 +3668,24 @@ class Bar:
             self.bar_bg_img.resize((self.rect.width - 2 * self.bar_border_width,
                                     self.rect.height - 2 * self.bar_border_width))
 
+    def __setattr__(self, key, value) -> None:
+        if key == 'rect':
+            old_rect = vars(self).get('rect')
+            if isinstance(old_rect, Rect | SlottedRect):
+                old_rect.remove_geometry_observer(self._rect_moved)
+            if isinstance(value, Rect | SlottedRect):
+                value.add_geometry_observer(self._rect_moved)
+
+        old_bounds = DirtyRects.before_change(self, key, value) if DirtyRects.tracking else None
+        super().__setattr__(key, value)
+        if key in Bar._geometry_attributes:
+            vars(self)['_geometry_valid'] = False
+        if old_bounds is not None:
+            DirtyRects.changed(self, old_bounds)
+
+    def _rect_moved(self, rect: Rect) -> None:
+        self._geometry_valid = False
+
     @property
     def text_str(self) -> str:
         return self._text.text
@@ -1223,6 +3708,15 @@ class Bar:
         else:
             raise NotImplemented
 
+    @property
+    def parts(self) -> tuple:
+        return self.rect, self.text, self.bar_bg_img
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        return self.rect.bounds.unionall([part.bounds for part in (self.bar_bg_img, self.text)
+                                          if part is not None and part.bounds is not None])
+
     @property
     def percentage(self) -> tuple[float, ...]:
         return tuple(round(self.goal_value_range[i] / self.max_value_range[1] * 100, 1) for i in range(2))
@@ -1240,8 +3734,9 @@ class Bar:
 
         self.goal_value_range[target_index] = set_value
 
-        if self not in Bar.moving_bars:
-            Bar.moving_bars.append(self)
+        Bar.moving_bars[id(self)] = self
+        if Bar.movement is not None:
+            Bar.movement.add(self)
 
     def modify_value(self, value: float, set_bottom: bool = False) -> None:
         target_index = 1 if not set_bottom else 0
@@ -1276,99 +3771,351 @@ class Bar:
             return (self.rect.width - 2 * self.bar_border_width,
                     self.get_bar_height(bar_max) - self.get_bar_height(bar_min))
 
-    def render(self, display: pygame.Surface | None = None) -> None:
-        display = display if display is not None else Display.window()
-        if display is None:
-            raise ValueError('Display argument missing')
-
-        self.rect.render(display)
-
+    def update_geometry(self) -> None:
+        border = self.bar_border_width
         if self.start_fill_side == Placement.LEFT:
-            bar_x = self.rect.x + self.bar_border_width + self.get_bar_width(min(self.display_range))
-            bar_y = self.rect.y + self.bar_border_width
+            bar_x = self.rect.x + border + self.get_bar_width(min(self.display_range))
+            bar_y = self.rect.y + border
         else:
-            bar_x = self.rect.x + self.bar_border_width
-            bar_y = self.rect.y + self.bar_border_width + self.get_bar_height(self.max_value_range[1] -
-                                                                              max(self.display_range))
-        bar_size = self.get_bar_size()
-
-        if self.bar_bg_img is not None:
-            self.bar_bg_img.render(display)
-
-        color = self.bar_color
-        if self.display_range[0] > self.display_range[1] and self.bar_inverse_color is not None:
-            color = self.bar_inverse_color
-
-        bar_rect = Rect(bar_x, bar_y, bar_size[0], bar_size[1], color=color)
-
-        bar_rect.render(display)
+            bar_x = self.rect.x + border
+            bar_y = self.rect.y + border + self.get_bar_height(self.max_value_range[1] - max(self.display_range))
+        bar_width, bar_height = self.get_bar_size()
+        self._fill_rect.update(bar_x, bar_y, bar_width, bar_height)
 
+        stop_rects = []
         if self.bar_closed:
             if self.start_fill_side == Placement.LEFT:
-                stop_width = self.bar_border_width
-                stop_height = self.rect.height - 2 * self.bar_border_width
+                stop_width = border
+                stop_height = self.rect.height - 2 * border
             else:
-                stop_width = self.rect.width - 2 * self.bar_border_width
-                stop_height = self.bar_border_width
+                stop_width = self.rect.width - 2 * border
+                stop_height = border
 
             if self.max_value_range[0] <= self.display_range[1] < self.max_value_range[1]:
                 if self.start_fill_side == Placement.LEFT:
-                    max_stop_block = Rect(bar_x + bar_size[0], bar_y, stop_width, stop_height,
-                                          color=self.rect.color)
+                    self._max_stop_rect.update(bar_x + bar_width, bar_y, stop_width, stop_height)
                 else:
-                    max_stop_block = Rect(bar_x, bar_y - self.bar_border_width, stop_width, stop_height,
-                                          color=self.rect.color)
-
-                max_stop_block.render(display)
+                    self._max_stop_rect.update(bar_x, bar_y - border, stop_width, stop_height)
+                stop_rects.append(self._max_stop_rect)
 
             if self.max_value_range[0] < self.display_range[0] <= self.max_value_range[1]:
                 if self.start_fill_side == Placement.LEFT:
-                    max_stop_block = Rect(bar_x - self.bar_border_width, self.rect.y + self.bar_border_width,
-                                          stop_width, stop_height, color=self.rect.color)
+                    self._min_stop_rect.update(bar_x - border, self.rect.y + border, stop_width, stop_height)
                 else:
-                    max_stop_block = Rect(self.rect.x + self.bar_border_width,
-                                          bar_y + bar_size[1] - self.bar_border_width, stop_width, stop_height,
-                                          color=self.rect.color)
+                    self._min_stop_rect.update(self.rect.x + border, bar_y + bar_height - border, stop_width,
+                                               stop_height)
+                stop_rects.append(self._min_stop_rect)
+
+        self._stop_rects = tuple(stop_rects)
+        self._geometry_valid = True
+
+    def render(self, display: pygame.Surface | None = None) -> None:
+        display = display if display is not None else Display.window()
+        if display is None:
+            raise ValueError('Display argument missing')
+
+        if not self._geometry_valid:
+            self.update_geometry()
+
+        self.rect.render(display)
+        if self.bar_bg_img is not None:
+            self.bar_bg_img.render(display)
+
+        color = self.bar_color
+        if self.display_range[0] > self.display_range[1] and self.bar_inverse_color is not None:
+            color = self.bar_inverse_color
 
-                max_stop_block.render(display)
+        BlitBatch.barrier(display)
+        pygame.draw.rect(display, color, self._fill_rect)
+        for stop_rect in self._stop_rects:
+            pygame.draw.rect(display, self.rect.color, stop_rect)
 
         if self.text is not None:
             self.text.render(display)
 
     def process_bar_movement(self) -> None:
+        if DirtyRects.tracking:
+            DirtyRects.changed(self)
+        self._geometry_valid = False
+
         for side in range(2):
             if self.display_range[side] != self.goal_value_range[side]:
                 delta_value = self.goal_value_range[side] - self.display_range[side]
                 move_level = self.bar_speed * delta_value / self.display_fps
                 move_level = int(move_level if move_level % 1 == 0 else move_level + (1 if delta_value > 0 else -1))
+                if abs(move_level) > abs(delta_value):
+                    move_level = delta_value
 
                 self.display_range[side] = min(max(self.display_range[side] + move_level,
                                                    self.max_value_range[0]), self.max_value_range[1])
 
-        if self.display_range == self.goal_value_range and self in Bar.moving_bars:
-            Bar.moving_bars.remove(self)
+        if self.display_range == self.goal_value_range:
+            Bar.moving_bars.pop(id(self), None)
+
+    @classmethod
+    def use_movement_engine(cls, enabled: bool = True, capacity: int = 1024) -> None:
+        if enabled:
+            cls.movement = BarMovement(capacity)
+            for bar in cls.moving_bars.values():
+                cls.movement.add(bar)
+        else:
+            cls.movement = None
 
     @classmethod
+    @RenderProfiler.section('Bar.process_all_bar_movement')
     def process_all_bar_movement(cls) -> None:
-        for bar in cls.moving_bars:
+        if cls.movement is not None:
+            cls.movement.step()
+            return
+
+        for bar in list(cls.moving_bars.values()):
             bar.process_bar_movement()
 
 
+class BarMovement:
+    clock: Callable[[], float] = time.monotonic
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if np is None:
+            raise ImportError('BarMovement requires numpy')
+
+        self._bars: list[Bar] = []
+        self._rows: dict[int, int] = {}
+        self._display = np.zeros((capacity, 2), dtype=np.float64)
+        self._goal = np.zeros((capacity, 2), dtype=np.float64)
+        self._low = np.zeros((capacity, 1), dtype=np.float64)
+        self._high = np.zeros((capacity, 1), dtype=np.float64)
+        self._speed = np.zeros((capacity, 1), dtype=np.float64)
+        self.last_time: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._bars)
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._display):
+            return
+        capacity = max(size, 2 * len(self._display))
+        for name in ('_display', '_goal', '_low', '_high', '_speed'):
+            array = getattr(self, name)
+            grown = np.zeros((capacity, array.shape[1]), dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add(self, bar: Bar) -> None:
+        row = self._rows.get(id(bar))
+        if row is None:
+            if not self._bars:
+                self.last_time = BarMovement.clock()
+            row = len(self._bars)
+            self._reserve(row + 1)
+            self._rows[id(bar)] = row
+            self._bars.append(bar)
+
+        self._display[row] = bar.display_range
+        self._goal[row] = bar.goal_value_range
+        self._low[row] = bar.max_value_range[0]
+        self._high[row] = bar.max_value_range[1]
+        self._speed[row] = bar.bar_speed
+
+    def remove(self, bar: Bar) -> None:
+        row = self._rows.pop(id(bar), None)
+        if row is None:
+            return
+
+        last_row = len(self._bars) - 1
+        last_bar = self._bars.pop()
+        if row != last_row:
+            self._bars[row] = last_bar
+            self._rows[id(last_bar)] = row
+            for array in (self._display, self._goal, self._low, self._high, self._speed):
+                array[row] = array[last_row]
+
+    def step(self, now: float | None = None) -> None:
+        count = len(self._bars)
+        if count == 0:
+            return
+        now = BarMovement.clock() if now is None else now
+        elapsed = max(now - self.last_time, 0.0) if self.last_time is not None else 0.0
+        self.last_time = now
+
+        display = self._display[:count]
+        goal = self._goal[:count]
+        delta = goal - display
+        move = self._speed[:count] * delta * elapsed
+        move = np.sign(delta) * np.ceil(np.abs(move))
+        move = np.where(np.abs(move) > np.abs(delta), delta, move)
+        display += move
+        np.clip(display, self._low[:count], self._high[:count], out=display)
+
+        changed_rows = np.flatnonzero((move != 0).any(axis=1))
+        for row, values in zip(changed_rows.tolist(), display[changed_rows].tolist()):
+            bar = self._bars[row]
+            bar.display_range[:] = values
+            bar._geometry_valid = False
+            if DirtyRects.tracking:
+                DirtyRects.changed(bar)
+
+        for row in np.flatnonzero((display == goal).all(axis=1))[::-1].tolist():
+            bar = self._bars[row]
+            Bar.moving_bars.pop(id(bar), None)
+            self.remove(bar)
+
+
+class EventDispatcher:
+    def __init__(self) -> None:
+        self._handlers: dict[int, list[Callable]] = {}
+        self.version = 0
+
+    @property
+    def event_types(self) -> tuple[int, ...]:
+        return tuple(self._handlers.keys())
+
+    def handlers(self, event_type: int) -> list[Callable]:
+        return self._handlers.get(event_type, [])
+
+    def add_handler(self, event_type: int, handler: Callable) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+        self.version += 1
+
+    def remove_handler(self, event_type: int, handler: Callable) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers is not None and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event_type]
+            self.version += 1
+
+
+class SceneLayer:
+    def __init__(self) -> None:
+        self.surface: pygame.Surface | None = None
+        self.valid = False
+        self.objects: list | None = None
+        self._part_ids: set[int] = set()
+        self._volatile = False
+        self._loading_images: list[Image] = []
+        self._render_calls: list[Callable] = []
+        self._profiled = False
+        self.name = 'universal'
+
+    def track(self, objects: list, name: str = 'universal') -> None:
+        parts = [part for obj in objects for part in Scene.object_parts(obj)]
+        self.objects = objects
+        self.name = name
+        self._part_ids = {id(part) for part in parts}
+        self._volatile = not all(Scene.reports_changes(part) for part in parts)
+        self._loading_images = [part for part in parts if isinstance(part, Image) and part.loading]
+        self._render_calls = self.compile_render_calls()
+        self.valid = False
+
+    def compile_render_calls(self) -> list[Callable]:
+        render_calls = [obj.render if getattr(type(obj), 'batched_render', False)
+                        else BlitBatch.barrier_render(obj.render) for obj in self.objects]
+        self._profiled = RenderProfiler.enabled
+        if self._profiled:
+            render_calls = [RenderProfiler.profile_render(render, f'{self.name}/{type(obj).__name__}[{index}]',
+                                                          type(obj).__name__)
+                            for index, (obj, render) in enumerate(zip(self.objects, render_calls))]
+        return render_calls
+
+    def untrack(self) -> None:
+        self.objects = None
+        self.valid = False
+
+    def object_changed(self, obj: object) -> None:
+        if id(obj) in self._part_ids:
+            self.valid = False
+
+    def render(self, display: pygame.Surface, bg_color: T_COLOR | None, alpha: int | None) -> pygame.Surface:
+        if self._loading_images and any([image.poll_asset() for image in self._loading_images]):
+            self._loading_images = [image for image in self._loading_images if image.loading]
+            self.valid = False
+
+        size = display.get_size()
+        if self.surface is None or self.surface.get_size() != size:
+            if bg_color is None or alpha is not None:
+                self.surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+            else:
+                self.surface = pygame.Surface(size, 0, display)
+            self.valid = False
+
+        if self._profiled != RenderProfiler.enabled:
+            self._render_calls = self.compile_render_calls()
+
+        if not self.valid or self._volatile:
+            self.surface.fill(bg_color if bg_color is not None else (0, 0, 0, 0))
+            previous_target = BlitBatch.begin(self.surface)
+            try:
+                for render in self._render_calls:
+                    render(self.surface)
+            finally:
+                BlitBatch.end(previous_target)
+            self.valid = True
+
+        if alpha is not None or self.surface.get_alpha() is not None:
+            self.surface.set_alpha(alpha if alpha is not None else 255)
+        return self.surface
+
+
 class Scene:
     active_scenes: MutableSequence | None = []
     all_scenes: MutableSequence | None = []
     universal_objects: list | None = []
+    universal_events: EventDispatcher = EventDispatcher()
+    _universal_version: int = 0
+    _event_routes: dict[int, list[tuple[Callable, Mapping | None]]] = {}
+    _event_routes_key: tuple | None = None
+    change_reporting_types: tuple[type, ...] = (Shape, SlottedShape, Text, Image, InputField, Button, Bar)
+    universal_layer: SceneLayer = SceneLayer()
+    _universal_layer_key: tuple | None = None
 
     def __init__(self, name: str | None = None, bg_color: T_COLOR | None = (0, 0, 0),
-                 objects: Iterable | MutableMapping | None = None) -> None:
+                 objects: Iterable | MutableMapping | None = None, static_objects: Iterable | None = None,
+                 auto_static: bool = False, z_index: int = 0, alpha: int | None = None) -> None:
         if name in [scene.name for scene in Scene.all_scenes]:
             raise ValueError('name already taken')
         else:
             self.name = name
         self.bg_color = bg_color
+        self.z_index = z_index
+        self.alpha = alpha
+        self.layer = SceneLayer()
+        self.static_objects = list(static_objects) if static_objects is not None else []
+        self.auto_static = auto_static
+
+        self._static_layer: pygame.Surface | None = None
+        self._static_layer_valid = False
+        self._static_render_objects: list | None = None
+        self._dynamic_render_objects: list = []
+        self._static_owners: dict[int, object] = {}
+        self._demoted_ids: set[int] = set()
+        self._loading_images: list[Image] = []
+
+        self._render_objects: list | None = None
+        self._render_calls: list[Callable] | None = None
+        self._render_key: tuple | None = None
+        self._render_bounds: list[pygame.Rect | None] = []
+        self._bounds_cacheable: list[bool] = []
+        self._bounds_owners: dict[int, list[int]] = {}
+        self._members_version = 0
+        self.events = EventDispatcher()
         self.objects = objects
         Scene.all_scenes.append(self)
 
+    @property
+    def objects(self) -> Iterable | MutableMapping | None:
+        return self._objects
+
+    @objects.setter
+    def objects(self, value: Iterable | MutableMapping | None) -> None:
+        objects_list = value.values() if isinstance(value, Mapping) else value
+        if objects_list is not None:
+            for obj in objects_list:
+                Scene.validate_object(obj)
+
+        self._objects = value
+        self.invalidate_render_list()
+
     @property
     def objects_list(self) -> list:
         if isinstance(self.objects, Mapping):
@@ -1379,34 +4126,358 @@ class Scene:
             return NotImplemented
         return list(objects_list)
 
+    @staticmethod
+    def validate_object(obj: object) -> None:
+        if not isinstance(obj, DisplayObject):
+            raise NotImplementedError('Cannot render objects which are not DisplayObject')
+
+    def add_object(self, obj: DisplayObject, key: Hashable | None = None) -> None:
+        Scene.validate_object(obj)
+
+        if isinstance(self.objects, MutableMapping):
+            if key is None:
+                raise ValueError('Provide a key to add objects to a Mapping based Scene')
+            self.objects[key] = obj
+        elif isinstance(self.objects, MutableSequence):
+            self.objects.append(obj)
+        elif self.objects is None:
+            self._objects = [obj] if key is None else {key: obj}
+        else:
+            raise TypeError('Scene objects must be a MutableSequence or MutableMapping to add objects')
+
+        self.invalidate_render_list()
+
+    def remove_object(self, obj: DisplayObject | None = None, key: Hashable | None = None) -> None:
+        if isinstance(self.objects, MutableMapping):
+            if key is None:
+                key = next((obj_key for obj_key, value in self.objects.items() if value is obj), None)
+            if key in self.objects:
+                del self.objects[key]
+        elif isinstance(self.objects, MutableSequence):
+            if obj in self.objects:
+                self.objects.remove(obj)
+        else:
+            raise TypeError('Scene objects must be a MutableSequence or MutableMapping to remove objects')
+
+        self.invalidate_render_list()
+
+    @classmethod
+    def add_universal_object(cls, obj: DisplayObject) -> None:
+        Scene.validate_object(obj)
+        cls.universal_objects.append(obj)
+        cls._universal_version += 1
+
+    @classmethod
+    def remove_universal_object(cls, obj: DisplayObject) -> None:
+        if obj in cls.universal_objects:
+            cls.universal_objects.remove(obj)
+            cls._universal_version += 1
+
+    @classmethod
+    def _universal_key(cls) -> tuple[int, int, int]:
+        return id(cls.universal_objects), len(cls.universal_objects), cls._universal_version
+
+    def invalidate_render_list(self) -> None:
+        self._members_version += 1
+        self._render_calls = None
+        self._render_objects = None
+        self.invalidate_static_layer(split=True)
+        self.layer.untrack()
+
+    def compile_render_list(self) -> None:
+        if self.uses_static_layer:
+            if self._static_render_objects is None:
+                self.split_layers()
+            scene_objects = self._dynamic_render_objects
+        else:
+            scene_objects = self.objects_list
+
+        for obj in Scene.universal_objects:
+            Scene.validate_object(obj)
+
+        self._render_objects = scene_objects + Scene.universal_objects
+        self._render_calls = [obj.render if getattr(type(obj), 'batched_render', False)
+                              else BlitBatch.barrier_render(obj.render) for obj in self._render_objects]
+
+        self._render_bounds = [None] * len(self._render_objects)
+        self._bounds_cacheable = []
+        self._bounds_owners = {}
+        for index, obj in enumerate(self._render_objects):
+            parts = Scene.object_parts(obj)
+            self._bounds_cacheable.append(all(Scene.reports_changes(part) for part in parts))
+            if self._bounds_cacheable[-1]:
+                for part in parts:
+                    self._bounds_owners.setdefault(id(part), []).append(index)
+        if RenderProfiler.enabled:
+            self._render_calls = [RenderProfiler.profile_render(render, self.profile_name(obj, index),
+                                                                type(obj).__name__)
+                                  for index, (obj, render) in enumerate(zip(self._render_objects, self._render_calls))]
+        self._render_key = self._render_list_key()
+
+    def _render_list_key(self) -> tuple:
+        return Scene._universal_key() + (RenderProfiler.enabled,)
+
+    def profile_name(self, obj: object, index: int) -> str:
+        scene_count = len(self._render_objects) - len(Scene.universal_objects)
+        if index >= scene_count:
+            return f'universal/{type(obj).__name__}[{index - scene_count}]'
+        if self.uses_static_layer:
+            index += len(self._static_render_objects)
+        return f'{self.name}/{type(obj).__name__}[{index}]'
+
+    @property
+    def uses_static_layer(self) -> bool:
+        return self.auto_static or len(self.static_objects) > 0
+
+    @staticmethod
+    def object_parts(obj: object) -> list:
+        parts = [obj]
+        for part in getattr(obj, 'parts', ()):
+            if part is not None:
+                parts.extend(Scene.object_parts(part))
+        return parts
+
+    @staticmethod
+    def reports_changes(obj: object) -> bool:
+        return isinstance(obj, Scene.change_reporting_types)
+
+    @classmethod
+    def _set_active_scenes(cls, active_scenes: MutableSequence) -> None:
+        for scene in cls.active_scenes:
+            if scene not in active_scenes:
+                DirtyRects.remove_listener(scene.static_object_changed)
+        for scene in active_scenes:
+            if scene.uses_static_layer:
+                scene.invalidate_static_layer(split=True)
+                DirtyRects.add_listener(scene.static_object_changed)
+            scene.layer.valid = False
+
+        if len(active_scenes) > 1:
+            DirtyRects.add_listener(cls.layer_object_changed)
+        else:
+            DirtyRects.remove_listener(cls.layer_object_changed)
+        cls.universal_layer.valid = False
+        cls.active_scenes = active_scenes
+
     def activate(self, deactivate_all: bool = True) -> None:
+        DirtyRects.invalidate()
         if deactivate_all:
-            Scene.active_scenes = [self]
+            Scene._set_active_scenes([self])
         else:
-            Scene.active_scenes.insert(-1, self)
+            active_scenes = [scene for scene in Scene.active_scenes if scene is not self] + [self]
+            Scene._set_active_scenes(sorted(active_scenes, key=lambda scene: scene.z_index))
 
     def deactivate(self, deactivate_all: bool = False) -> None:
+        DirtyRects.invalidate()
         if deactivate_all:
-            Scene.active_scenes = []
+            Scene._set_active_scenes([])
         else:
             if self in Scene.active_scenes:
-                Scene.active_scenes.remove(self)
+                Scene._set_active_scenes([scene for scene in Scene.active_scenes if scene is not self])
+
+    def split_layers(self) -> None:
+        explicit_ids = {id(obj) for obj in self.static_objects}
+        static_objects, dynamic_objects = [], []
+        static_prefix = True
+
+        for obj in self.objects_list:
+            static = id(obj) in explicit_ids or (self.auto_static and isinstance(obj, Shape | SlottedShape | Image)
+                                                 and id(obj) not in self._demoted_ids)
+            if static_prefix and static and all(Scene.reports_changes(part) for part in Scene.object_parts(obj)):
+                static_objects.append(obj)
+            else:
+                static_prefix = False
+                dynamic_objects.append(obj)
+
+        self._static_render_objects = static_objects
+        self._dynamic_render_objects = dynamic_objects
+        self._static_owners = {id(part): obj for obj in static_objects for part in Scene.object_parts(obj)}
+
+    def invalidate_static_layer(self, split: bool = False) -> None:
+        self._static_layer_valid = False
+        if split:
+            self._static_render_objects = None
+            self._render_calls = None
+
+    def static_object_changed(self, obj: object) -> None:
+        owner = self._static_owners.get(id(obj))
+        if owner is None:
+            return
 
-    def render(self, display: pygame.Surface | None = None) -> None:
+        if owner not in self.static_objects:
+            self._demoted_ids.add(id(owner))
+            self.invalidate_static_layer(split=True)
+        else:
+            self.invalidate_static_layer()
+
+    def render_static_layer(self, display: pygame.Surface) -> pygame.Surface:
+        if self._static_render_objects is None:
+            self.split_layers()
+
+        size = display.get_size()
+        if self._static_layer is None or self._static_layer.get_size() != size:
+            if self.bg_color is None:
+                self._static_layer = pygame.Surface(size, pygame.SRCALPHA, 32)
+            else:
+                self._static_layer = pygame.Surface(size, 0, display)
+            self._static_layer_valid = False
+
+        if self._loading_images and any([image.poll_asset() for image in self._loading_images]):
+            self._static_layer_valid = False
+
+        if not self._static_layer_valid:
+            self._static_layer.fill(self.bg_color if self.bg_color is not None else (0, 0, 0, 0))
+            for index, obj in enumerate(self._static_render_objects):
+                if RenderProfiler.enabled:
+                    RenderProfiler.profile_render(obj.render, f'{self.name}/{type(obj).__name__}[{index}]',
+                                                  type(obj).__name__)(self._static_layer)
+                else:
+                    obj.render(self._static_layer)
+            self._loading_images = [part for obj in self._static_render_objects for part in Scene.object_parts(obj)
+                                    if isinstance(part, Image) and part.loading]
+            self._static_layer_valid = True
+
+        return self._static_layer
+
+    @RenderProfiler.section('Scene.render')
+    def render(self, display: pygame.Surface | None = None) -> list[pygame.Rect] | None:
         display = display if display is not None else Display.window()
         if display is None:
             raise ValueError('Display argument missing')
 
-        if self.bg_color is not None:
+        if self._render_calls is None or self._render_key != self._render_list_key():
+            self.compile_render_list()
+
+        if DirtyRects.enabled:
+            return self.render_dirty(display)
+
+        render_calls = self._render_calls
+        if self.uses_static_layer:
+            display.blit(self.render_static_layer(display), (0, 0))
+        elif self.bg_color is not None:
             display.fill(self.bg_color)
 
-        render_objects = self.objects_list + Scene.universal_objects
+        previous_target = BlitBatch.begin(display)
+        try:
+            for render in render_calls:
+                render(display)
+        finally:
+            BlitBatch.end(previous_target)
 
-        for obj in render_objects:
-            if isinstance(obj, DisplayObject):
-                obj.render(display)
-            else:
-                raise NotImplementedError('Cannot render objects which are not DisplayObject')
+    @classmethod
+    def layer_object_changed(cls, obj: object) -> None:
+        for scene in cls.active_scenes:
+            scene.layer.object_changed(obj)
+        cls.universal_layer.object_changed(obj)
+
+    @classmethod
+    @RenderProfiler.section('Scene.render_active')
+    def render_active(cls, display: pygame.Surface | None = None) -> list[pygame.Rect] | None:
+        """Renders all active scenes, compositing cached layers when several scenes are active."""
+        display = display if display is not None else Display.window()
+        if display is None:
+            raise ValueError('Display argument missing')
+
+        if len(cls.active_scenes) <= 1:
+            return cls.active_scenes[0].render(display) if cls.active_scenes else None
+
+        for scene in cls.active_scenes:
+            if scene.layer.objects is None:
+                scene.layer.track(scene.objects_list if scene.objects is not None else [], scene.name)
+            display.blit(scene.layer.render(display, scene.bg_color, scene.alpha), (0, 0))
+
+        if cls.universal_objects:
+            if cls._universal_layer_key != cls._universal_key():
+                cls.universal_layer.track(list(cls.universal_objects))
+                cls._universal_layer_key = cls._universal_key()
+            display.blit(cls.universal_layer.render(display, None, None), (0, 0))
+
+    def render_dirty(self, display: pygame.Surface) -> list[pygame.Rect]:
+        scene_objects, render_calls = self._render_objects, self._render_calls
+        static_layer = self.render_static_layer(display) if self.uses_static_layer else None
+        render_bounds, bounds_cacheable = self._render_bounds, self._bounds_cacheable
+        changed_ids = DirtyRects.take_changes(self)
+        if changed_ids is None:
+            render_bounds[:] = [None] * len(render_bounds)
+        else:
+            for changed_id in changed_ids:
+                for index in self._bounds_owners.get(changed_id, ()):
+                    render_bounds[index] = None
+
+        dirty_rects = DirtyRects.collect(display.get_rect())
+        if not dirty_rects:
+            return dirty_rects
+
+        render_objects = []
+        for index, (obj, render) in enumerate(zip(scene_objects, render_calls)):
+            bounds = render_bounds[index]
+            if bounds is None:
+                bounds = getattr(obj, 'bounds', None)
+                if bounds_cacheable[index]:
+                    render_bounds[index] = bounds
+            render_objects.append((render, bounds))
+
+        previous_target = BlitBatch.begin(display)
+        try:
+            for dirty_rect in dirty_rects:
+                display.set_clip(dirty_rect)
+                if static_layer is not None:
+                    display.blit(static_layer, dirty_rect, dirty_rect)
+                elif self.bg_color is not None:
+                    display.fill(self.bg_color, dirty_rect)
+
+                for render, bounds in render_objects:
+                    if bounds is None or bounds.colliderect(dirty_rect):
+                        render(display)
+                BlitBatch.flush()
+        finally:
+            BlitBatch.end(previous_target)
+            display.set_clip(None)
+
+        return dirty_rects
+
+    @classmethod
+    def compile_event_routes(cls) -> dict[int, list[tuple[Callable, Mapping | None]]]:
+        routes_key = (tuple((id(scene), scene._members_version, scene.events.version) for scene in cls.active_scenes),
+                      cls._universal_key(), cls.universal_events.version)
+        if routes_key == cls._event_routes_key:
+            return cls._event_routes
+
+        listener_members: dict[type, dict[int, object]] = {}
+        dispatchers = [scene.events for scene in cls.active_scenes] + [cls.universal_events]
+        listener_objects = [obj for scene in cls.active_scenes if scene.objects is not None
+                            for obj in scene.objects_list] + cls.universal_objects
+
+        for obj in listener_objects:
+            if hasattr(type(obj), 'handle_events'):
+                listener_members.setdefault(type(obj), {})[id(obj)] = obj
+
+        routes = {}
+        for listener_cls, members in listener_members.items():
+            for event_type in listener_cls.event_types:
+                routes.setdefault(event_type, []).append((listener_cls.handle_events, members))
+        for dispatcher in dispatchers:
+            for event_type in dispatcher.event_types:
+                routes.setdefault(event_type, []).extend((handler, None) for handler in dispatcher.handlers(event_type))
+
+        cls._event_routes = routes
+        cls._event_routes_key = routes_key
+        return routes
+
+    @classmethod
+    @RenderProfiler.section('Scene.dispatch_event')
+    def dispatch_event(cls, event: pygame.event.Event) -> list:
+        results = []
+        for handler, members in cls.compile_event_routes().get(event.type, ()):
+            result = handler(event) if members is None else handler(event, members)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def preload_assets(self) -> AssetPreloader:
+        objects = self.objects_list if self.objects is not None else []
+        return AssetPreloader(part.path for obj in objects for part in Scene.object_parts(obj)
+                              if isinstance(part, Image) and part.loading)
 
     def detect_object(self, obj: object) -> bool:
         return obj in self.objects_list